@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from functools import partial
 from typing import TYPE_CHECKING
 
 from homeassistant.const import (
@@ -14,17 +16,41 @@ from homeassistant.const import (
     Platform,
 )  # CONF_SCAN_INTERVAL kept for migration
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from pyomnilogic_local import OmniLogic
+from pyomnilogic_local.api.api import OmniLogicAPI
 from pyomnilogic_local.omnitypes import OmniType
 
-from .const import BACKYARD_SYSTEM_ID, DOMAIN, KEY_COORDINATOR
+from .const import (
+    BACKYARD_SYSTEM_ID,
+    CONF_MQTT_PREFIX,
+    CONF_PROXY,
+    CONF_PROXY_SECRET,
+    CONF_PROXY_SERVER_HOST,
+    CONF_PROXY_SERVER_PORT,
+    DEFAULT_PROXY_HOST,
+    DOMAIN,
+    ENV_REPLAY,
+    ENV_REPLAY_ENTRY,
+    ENV_REPLAY_SPEED,
+    KEY_COORDINATOR,
+)
 from .coordinator import OmniLogicCoordinator
+from .energy import EnergyMeter
+from .metrics import OmniLogicMetricsView
+from .proxy import OmniLogicProxyServer, ProxyOmniLogicAPI
+from .recording import ReplayOmniLogicAPI, async_replay, async_stop_recording, load_recording
+from .runtime import RuntimeTracker
+from .services import async_setup_services
+from .transport import InstrumentedOmniLogicAPI
+from .websocket import async_setup_websocket_api
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -39,11 +65,35 @@ PLATFORMS: list[Platform] = [
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the OmniLogic Local integration."""
+    async_setup_services(hass)
+    hass.http.register_view(OmniLogicMetricsView())
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OmniLogic Local from a config entry."""
     # Create an API instance
     omni = OmniLogic(entry.data[CONF_IP_ADDRESS], entry.data[CONF_PORT], entry.data[CONF_TIMEOUT])
+    replay_api: ReplayOmniLogicAPI | None = None
+    if (replay_path := os.environ.get(ENV_REPLAY)) and os.environ.get(ENV_REPLAY_ENTRY) == entry.entry_id:
+        # Serve a recording through the integration instead of talking to the controller, used for offline profiling
+        recording = await hass.async_add_executor_job(load_recording, replay_path)
+        omni._api = replay_api = ReplayOmniLogicAPI(recording)
+    elif entry.data.get(CONF_PROXY, False):
+        # The address is another instance of this integration sharing its controller connection
+        omni._api = proxy_api = ProxyOmniLogicAPI(
+            entry.data[CONF_IP_ADDRESS], entry.data[CONF_PORT], entry.data[CONF_TIMEOUT], entry.data.get(CONF_PROXY_SECRET, "")
+        )
+        entry.async_on_unload(proxy_api.async_close)
+    elif isinstance(omni._api, OmniLogicAPI):
+        # The library swaps in a mock API in simulation mode, only replace the real one
+        omni._api = InstrumentedOmniLogicAPI(entry.data[CONF_IP_ADDRESS], entry.data[CONF_PORT], entry.data[CONF_TIMEOUT])
 
     # Validate that we can talk to the API endpoint
     try:
@@ -52,7 +102,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady from error
 
     # Create our data coordinator
-    coordinator = OmniLogicCoordinator(hass=hass, omni=omni)
+    coordinator = OmniLogicCoordinator(hass=hass, config_entry=entry, omni=omni, replaying=replay_api is not None)
+    coordinator.scheduler.register(entry.entry_id)
+    entry.async_on_unload(partial(coordinator.scheduler.unregister, entry.entry_id))
+    if isinstance(omni._api, InstrumentedOmniLogicAPI):
+        # Command traces include a span for each message the command sends to the controller
+        omni._api.listeners.append(coordinator.tracer)
+        if replay_api is None:
+            omni._api.request_limiter = coordinator.scheduler.request_limiter
+    await coordinator.energy.async_load()
+    await coordinator.runtime.async_load()
     await coordinator.async_config_entry_first_refresh()
 
     device_registry = dr.async_get(hass)
@@ -86,18 +145,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if (proxy_port := entry.data.get(CONF_PROXY_SERVER_PORT, 0)) and not entry.data.get(CONF_PROXY_SECRET):
+        _LOGGER.error("Not serving the OmniLogic proxy on port %s, set a shared secret in the integration options first", proxy_port)
+    elif proxy_port:
+        proxy_host = entry.data.get(CONF_PROXY_SERVER_HOST, DEFAULT_PROXY_HOST)
+        coordinator.proxy_server = OmniLogicProxyServer(coordinator, proxy_host, proxy_port, entry.data[CONF_PROXY_SECRET])
+        try:
+            await coordinator.proxy_server.async_start()
+        except OSError as err:
+            _LOGGER.error("Unable to serve the OmniLogic proxy on port %s: %s", proxy_port, err)
+            coordinator.proxy_server = None
+        else:
+            entry.async_on_unload(coordinator.proxy_server.async_stop)
+
+    if mqtt_prefix := entry.data.get(CONF_MQTT_PREFIX, ""):
+        # Only import the MQTT integration when the bridge is in use
+        from .mqtt_bridge import MqttBridge
+
+        bridge = MqttBridge(hass, coordinator, mqtt_prefix)
+        entry.async_create_background_task(hass, bridge.async_start(), f"{DOMAIN} mqtt bridge")
+        entry.async_on_unload(bridge.async_stop)
+
+    if replay_api is not None:
+        speed = float(os.environ.get(ENV_REPLAY_SPEED, "1"))
+        entry.async_create_background_task(hass, async_replay(coordinator, replay_api, speed), f"{DOMAIN} replay")
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: OmniLogicCoordinator = hass.data[DOMAIN].pop(entry.entry_id)[KEY_COORDINATOR]
+        await async_stop_recording(coordinator)
+        await coordinator.energy.async_save()
+        await coordinator.runtime.async_save()
     # I think it is a bug that the await for async_unload_platforms above has a signature that indicates it returns a bool, yet unload_ok
     # is detected as "Any" by mypy
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the energy totals and runtime counters stored for a removed config entry."""
+    await EnergyMeter(hass, entry.entry_id).async_remove()
+    await RuntimeTracker(hass, entry.entry_id).async_remove()
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     _LOGGER.debug("Migrating from version %s", config_entry.version)
@@ -6,15 +6,17 @@ from typing import TYPE_CHECKING
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
 from pyomnilogic_local import Backyard, Bow, Chlorinator, HeaterEquipment
 
-from .const import DOMAIN, KEY_COORDINATOR
-from .coordinator import OmniLogicCoordinator
-from .entity import OmniLogicEntity
+from .const import DOMAIN, ENTITY_PROFILE_STANDARD, KEY_COORDINATOR
+from .entity import OmniLogicEntity, cycle_cached
+from .entity_profile import apply_entity_profile
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .coordinator import OmniLogicCoordinator
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,7 +62,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             )
         )
 
-    async_add_entities(entities)
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 class OmniLogicServiceModeBinarySensorEntity(OmniLogicEntity[Backyard], BinarySensorEntity):
@@ -83,9 +85,12 @@ class OmniLogicServiceModeBinarySensorEntity(OmniLogicEntity[Backyard], BinarySe
 class OmniLogicHeaterEquipBinarySensorEntity(OmniLogicEntity[HeaterEquipment], BinarySensorEntity):
     """Binary sensor entity for heater equipment running status."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     _attr_device_class = BinarySensorDeviceClass.HEAT
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         return "mdi:water-boiler" if self.is_on else "mdi:water-boiler-off"
 
@@ -102,6 +107,7 @@ class OmniLogicFlowBinarySensorEntity(OmniLogicEntity[Bow], BinarySensorEntity):
     """Binary sensor entity for body of water flow status."""
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         return "mdi:water-check" if self.is_on else "mdi:water-remove"
 
@@ -117,6 +123,8 @@ class OmniLogicFlowBinarySensorEntity(OmniLogicEntity[Bow], BinarySensorEntity):
 class OmniLogicChlorinatorGeneratingSensorEntity(OmniLogicEntity[Chlorinator], BinarySensorEntity):
     """Binary sensor entity for chlorinator generating status."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     @property
     def name(self) -> str:
         return f"{self.equipment.name} Generating"
@@ -129,6 +137,8 @@ class OmniLogicChlorinatorGeneratingSensorEntity(OmniLogicEntity[Chlorinator], B
 class OmniLogicChlorinatorSuperChlorinatingSensorEntity(OmniLogicEntity[Chlorinator], BinarySensorEntity):
     """Binary sensor entity for chlorinator super-chlorinating status."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     @property
     def name(self) -> str:
         return f"{self.equipment.name} Super-Chlorinating"
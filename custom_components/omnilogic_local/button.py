@@ -7,8 +7,10 @@ from homeassistant.components.button import ButtonEntity
 from pyomnilogic_local import Backyard, Filter, Pump
 from pyomnilogic_local.omnitypes import FilterSpeedPresets, FilterType, PumpSpeedPresets, PumpType
 
-from .const import DOMAIN, KEY_COORDINATOR
+from .const import DOMAIN, ENTITY_PROFILE_FULL, ENTITY_PROFILE_STANDARD, KEY_COORDINATOR
 from .entity import OmniLogicEntity
+from .entity_profile import apply_entity_profile
+from .tracing import traced_command
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -37,7 +39,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     entities.append(OmniLogicIdleButtonEntity(coordinator=coordinator, equipment=coordinator.omni.backyard))
 
-    async_add_entities(entities)
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 type PumpTypes = Pump | Filter
@@ -47,6 +49,10 @@ type SpeedPresets = FilterSpeedPresets | PumpSpeedPresets
 class OmniLogicSpeedPresetButtonEntity[PT: PumpTypes](OmniLogicEntity[PT], ButtonEntity):
     """Button entity for triggering a pump or filter speed preset."""
 
+    entity_profile = ENTITY_PROFILE_FULL
+
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset({"speed"})
+
     def __init__(self, coordinator: OmniLogicCoordinator, equipment: PT, speed: SpeedPresets) -> None:
         super().__init__(coordinator, equipment)
         self.speed = speed
@@ -85,6 +91,7 @@ class OmniLogicPumpButtonEntity(OmniLogicSpeedPresetButtonEntity[Pump]):
 
     speed: PumpSpeedPresets
 
+    @traced_command
     async def async_press(self) -> None:
         await self.equipment.run_preset_speed(self.speed)
         self.coordinator.do_next_refresh_after()
@@ -95,6 +102,7 @@ class OmniLogicFilterButtonEntity(OmniLogicSpeedPresetButtonEntity[Filter]):
 
     speed: FilterSpeedPresets
 
+    @traced_command
     async def async_press(self) -> None:
         await self.equipment.run_preset_speed(self.speed)
         self.coordinator.do_next_refresh_after()
@@ -103,6 +111,8 @@ class OmniLogicFilterButtonEntity(OmniLogicSpeedPresetButtonEntity[Filter]):
 class OmniLogicIdleButtonEntity(OmniLogicEntity[Backyard], ButtonEntity):
     """Button entity for restoring the system to idle state."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     def __init__(self, coordinator: OmniLogicCoordinator, equipment: Backyard) -> None:
         super().__init__(coordinator, equipment)
 
@@ -110,6 +120,7 @@ class OmniLogicIdleButtonEntity(OmniLogicEntity[Backyard], ButtonEntity):
     def name(self) -> str:
         return "Restore Idle"
 
+    @traced_command
     async def async_press(self) -> None:
         await self.coordinator.omni._api.async_restore_idle_state()
         self.coordinator.do_next_refresh_after()
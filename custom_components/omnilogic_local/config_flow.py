@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
+import secrets
 from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
@@ -10,23 +13,56 @@ import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_IP_ADDRESS, CONF_NAME, CONF_PORT, CONF_TIMEOUT
 from homeassistant.core import callback
+from homeassistant.data_entry_flow import section
 from homeassistant.exceptions import HomeAssistantError
 from pyomnilogic_local import OmniLogic
+from pyomnilogic_local.api import OmniTimeoutError
 
-from .const import DOMAIN
+from .const import (
+    CONF_DEADBAND,
+    CONF_ENTITY_PROFILE,
+    CONF_MIN_INTERVAL,
+    CONF_MQTT_PREFIX,
+    CONF_PROXY,
+    CONF_PROXY_SECRET,
+    CONF_PROXY_SERVER_HOST,
+    CONF_PROXY_SERVER_PORT,
+    CONF_STATIC_ATTRIBUTES,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_PORT,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PUBLISH_POLICIES,
+    DEFAULT_STATIC_ATTRIBUTES,
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    ENTITY_PROFILES,
+    KEY_COORDINATOR,
+)
+from .discovery import address_unique_id, async_controller_unique_id, async_discover
+from .entity_profile import async_reconcile_entity_registry, profile_footprints
+from .proxy import ProxyOmniLogicAPI
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
+    from homeassistant.core import HomeAssistant
+
+    from .discovery import DiscoveredController
 
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+DEFAULT_NAME = "Omnilogic"
+DEFAULT_TIMEOUT = 5.0
+CONF_NETWORK = "network"
+
+STEP_MANUAL_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_IP_ADDRESS): cv.string,
-        vol.Required(CONF_NAME, default="Omnilogic"): cv.string,
-        vol.Optional(CONF_PORT, default=10444): cv.port,
-        vol.Optional(CONF_TIMEOUT, default=5.0): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=10.0)),
+        vol.Required(CONF_NAME, default=DEFAULT_NAME): cv.string,
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+        vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=10.0)),
+        vol.Optional(CONF_PROXY, default=False): cv.boolean,
+        vol.Optional(CONF_PROXY_SECRET, default=""): cv.string,
     }
 )
 
@@ -34,30 +70,82 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 async def validate_input(data: dict[str, Any]) -> None:
     """Validate the user input allows us to connect.
 
-    Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    Data has the keys from STEP_MANUAL_DATA_SCHEMA with values provided by the user.
+
+    Only the telemetry is requested, the smallest response the controller sends, setup downloads the MSP config anyway.
     """
     omni = OmniLogic(data[CONF_IP_ADDRESS], data[CONF_PORT], data[CONF_TIMEOUT])
+    proxy_api: ProxyOmniLogicAPI | None = None
+    if data.get(CONF_PROXY, False):
+        omni._api = proxy_api = ProxyOmniLogicAPI(
+            data[CONF_IP_ADDRESS], data[CONF_PORT], data[CONF_TIMEOUT], data.get(CONF_PROXY_SECRET, "")
+        )
     try:
-        await omni.refresh()
-    except TimeoutError as exc:
+        # The library retransmits unanswered requests, bound the whole exchange so the form doesn't hang for several timeouts
+        async with asyncio.timeout(data[CONF_TIMEOUT]):
+            await omni._api.async_get_telemetry()
+    except (TimeoutError, OmniTimeoutError) as exc:
         raise OmniLogicTimeout from exc
     except Exception as exc:
         raise CannotConnect from exc
+    finally:
+        if proxy_api is not None:
+            await proxy_api.async_close()
+
+
+def publish_policy_schema(options: dict[str, Any]) -> vol.Schema:
+    """Build the options schema for the per sensor kind deadbands and minimum publish intervals."""
+    schema: dict[vol.Marker, Any] = {
+        vol.Required(CONF_STATIC_ATTRIBUTES, default=options.get(CONF_STATIC_ATTRIBUTES, DEFAULT_STATIC_ATTRIBUTES)): cv.boolean,
+    }
+    for kind, (deadband, min_interval) in DEFAULT_PUBLISH_POLICIES.items():
+        configured = options.get(kind, {})
+        schema[vol.Required(kind)] = section(
+            vol.Schema(
+                {
+                    vol.Required(CONF_DEADBAND, default=configured.get(CONF_DEADBAND, deadband)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    ),
+                    vol.Required(CONF_MIN_INTERVAL, default=configured.get(CONF_MIN_INTERVAL, min_interval)): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=3600)
+                    ),
+                }
+            ),
+            {"collapsed": True},
+        )
+    return vol.Schema(schema)
+
+
+def footprint_summary(hass: HomeAssistant, entry_id: str) -> str:
+    """Describe the entity count and per refresh cost of each entity profile, for the options form."""
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        return "Load the integration to see how many entities each profile enables."
+    footprints = profile_footprints(entry_data[KEY_COORDINATOR])
+    return "\n".join(
+        f"- {profile.capitalize()}: {footprint['entities']} entities, about {footprint['cycle_ms']} ms per refresh"
+        for profile, footprint in footprints.items()
+    )
 
 
 class OptionsFlowHandler(OptionsFlow):
+    _connection: dict[str, Any]
+    _entities: dict[str, Any]
+
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
-        """Manage the options."""
+        """Manage the connection options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            user_input.update({"name": self.config_entry.data[CONF_NAME]})
-            # write updated config entries
-            self.hass.config_entries.async_update_entry(self.config_entry, data=user_input)
-            # # reload updated config entries
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
-            self.async_abort(reason="configuration updated")
-
-            return self.async_create_entry(data=user_input)
+            if user_input[CONF_PROXY_SERVER_PORT] and not user_input.get(CONF_PROXY_SECRET):
+                # The proxy forwards commands to the controller, it is never served without a secret
+                errors[CONF_PROXY_SECRET] = "proxy_secret_required"
+            else:
+                user_input.update({"name": self.config_entry.data[CONF_NAME]})
+                self._connection = user_input
+                return await self.async_step_entities()
 
+        data = self.config_entry.data
+        # A proxy client needs the owner's secret, an owner is offered a random one that its clients copy from here
+        secret = data.get(CONF_PROXY_SECRET) or ("" if data.get(CONF_PROXY) else secrets.token_urlsafe(32))
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
@@ -67,18 +155,131 @@ class OptionsFlowHandler(OptionsFlow):
                     vol.Required(CONF_TIMEOUT, default=self.config_entry.data[CONF_TIMEOUT]): vol.All(
                         vol.Coerce(float), vol.Range(min=0.5, max=10.0)
                     ),
+                    vol.Required(CONF_PROXY, default=self.config_entry.data.get(CONF_PROXY, False)): cv.boolean,
+                    vol.Required(CONF_PROXY_SERVER_PORT, default=self.config_entry.data.get(CONF_PROXY_SERVER_PORT, 0)): vol.Any(
+                        0, cv.port
+                    ),
+                    vol.Required(CONF_PROXY_SERVER_HOST, default=data.get(CONF_PROXY_SERVER_HOST, DEFAULT_PROXY_HOST)): cv.string,
+                    vol.Optional(CONF_PROXY_SECRET, default=secret): cv.string,
+                    vol.Optional(CONF_MQTT_PREFIX, default=self.config_entry.data.get(CONF_MQTT_PREFIX, "")): cv.string,
                 }
             ),
+            errors=errors,
+        )
+
+    async def async_step_entities(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Manage which entities are added."""
+        if user_input is not None:
+            self._entities = user_input
+            return await self.async_step_recorder()
+
+        profile = self.config_entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+        return self.async_show_form(
+            step_id="entities",
+            data_schema=vol.Schema({vol.Required(CONF_ENTITY_PROFILE, default=profile): vol.In(ENTITY_PROFILES)}),
+            description_placeholders={"footprints": footprint_summary(self.hass, self.config_entry.entry_id)},
         )
 
+    async def async_step_recorder(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Manage how often sensor readings are written to the state machine (and therefore the recorder)."""
+        if user_input is not None:
+            # Older versions stored a copy of the connection settings in the options, those belong in the entry data only
+            options = (
+                {
+                    key: value
+                    for key, value in self.config_entry.options.items()
+                    if key not in (CONF_IP_ADDRESS, CONF_NAME, CONF_PORT, CONF_TIMEOUT)
+                }
+                | self._entities
+                | user_input
+            )
+            profile = options[CONF_ENTITY_PROFILE]
+            entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+            if entry_data is not None and profile != self.config_entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE):
+                async_reconcile_entity_registry(self.hass, entry_data[KEY_COORDINATOR], profile)
+            # write updated config entries
+            self.hass.config_entries.async_update_entry(self.config_entry, data=self._connection, options=options)
+            # # reload updated config entries
+            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+
+            return self.async_create_entry(data=options)
+
+        return self.async_show_form(step_id="recorder", data_schema=publish_policy_schema(dict(self.config_entry.options)))
+
 
 class OmnilogicConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OmniLogic Local."""
 
     VERSION = 4
 
+    _discovered: dict[str, DiscoveredController]
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["discovery", "manual"])
+
+    async def async_step_discovery(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Search the local network, or the network entered, for controllers."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            networks: list[ipaddress.IPv4Network] | None = None
+            if user_input.get(CONF_NETWORK):
+                try:
+                    networks = [ipaddress.IPv4Network(user_input[CONF_NETWORK], strict=False)]
+                except ValueError:
+                    errors[CONF_NETWORK] = "invalid_network"
+                else:
+                    if networks[0].num_addresses > DISCOVERY_MAX_HOSTS:
+                        errors[CONF_NETWORK] = "network_too_large"
+            if not errors:
+                configured_hosts = {entry.data.get(CONF_IP_ADDRESS) for entry in self._async_current_entries(include_ignore=False)}
+                configured_ids = self._async_current_ids(include_ignore=False)
+                self._discovered = {
+                    controller.host: controller
+                    for controller in await async_discover(self.hass, networks)
+                    if controller.host not in configured_hosts and controller.unique_id not in configured_ids
+                }
+                if self._discovered:
+                    return await self.async_step_pick_controller()
+                errors["base"] = "no_controllers_found"
+
+        return self.async_show_form(
+            step_id="discovery",
+            data_schema=vol.Schema({vol.Optional(CONF_NETWORK): cv.string}),
+            errors=errors,
+        )
+
+    async def async_step_pick_controller(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Let the user pick one of the discovered controllers."""
+        if user_input is not None:
+            controller = self._discovered[user_input[CONF_IP_ADDRESS]]
+            # The controller may have been found under a new IP address, keep the existing entry pointed at it
+            await self.async_set_unique_id(controller.unique_id)
+            self._abort_if_unique_id_configured(updates={CONF_IP_ADDRESS: controller.host})
+            data = {
+                CONF_IP_ADDRESS: controller.host,
+                CONF_NAME: user_input[CONF_NAME],
+                CONF_PORT: controller.port,
+                CONF_TIMEOUT: DEFAULT_TIMEOUT,
+                CONF_PROXY: False,
+            }
+            return self.async_create_entry(title=user_input[CONF_NAME], data=data)
+
+        hosts = {
+            host: f"{host} ({controller.msp_version})" if controller.msp_version else host for host, controller in self._discovered.items()
+        }
+        return self.async_show_form(
+            step_id="pick_controller",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_IP_ADDRESS): vol.In(hosts),
+                    vol.Required(CONF_NAME, default=DEFAULT_NAME): cv.string,
+                }
+            ),
+        )
+
+    async def async_step_manual(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        """Set up a controller at an address entered by the user."""
         errors: dict[str, str] = {}
         if user_input is not None:
             try:
@@ -93,22 +294,17 @@ class OmnilogicConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception: %s", exc)
                 errors["base"] = "unknown"
             else:
-                # pylint: disable=fixme
-                # TODO: https://developers.home-assistant.io/docs/config_entries_config_flow_handler#unique-ids
-                # It would be nice to support unique IDs to prevent the same device being set up twice,
-                # but so far we don't have anything good that we can use for a unique ID. We could possibly leverage
-                # DHCP discovery, which would give us a MAC address that we could use.  The other option is the hostname,
-                # which by default has the mac address embedded in it, but that is technically capable of being changed
-                # if the user modifies their router configs to override the OmniLogic default hostname.
-                # For now, we are just asking for a name, and using that as the unique_id, which will be confusing because
-                # a use could rename the integration config entry, but that would not change this unique ID, although they
-                # came from the same source... yeah... it's janky... I'll make it better later... somehow
-                # we may need to use https://developers.home-assistant.io/docs/entity_registry_index/#unique-id-of-last-resort
-                await self.async_set_unique_id(user_input[CONF_NAME])
+                # The controller just answered us, so when it is on the local network the neighbour table knows its MAC address,
+                # which makes the same unique ID discovery uses. A proxy's MAC address would be the other Home Assistant's, and a
+                # routed controller has none we can see, those fall back to the address like discovery does.
+                unique_id = None
+                if not user_input.get(CONF_PROXY, False):
+                    unique_id = await async_controller_unique_id(self.hass, user_input[CONF_IP_ADDRESS])
+                await self.async_set_unique_id(unique_id or address_unique_id(user_input[CONF_IP_ADDRESS], user_input[CONF_PORT]))
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
 
-        return self.async_show_form(step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors)
+        return self.async_show_form(step_id="manual", data_schema=STEP_MANUAL_DATA_SCHEMA, errors=errors)
 
     @staticmethod
     @callback
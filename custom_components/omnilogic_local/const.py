@@ -8,9 +8,89 @@ from pyomnilogic_local.omnitypes import OmniType
 DOMAIN: Final[str] = "omnilogic_local"
 KEY_COORDINATOR: Final[str] = "coordinator"
 
+DEFAULT_PORT: Final[int] = 10444
+
 SCAN_INTERVAL = timedelta(seconds=10)
 UPDATE_DELAY_SECONDS: Final[float] = 1.5
 
+# Between scheduled transitions we poll more slowly, then poll shortly after each schedule starts or ends
+IDLE_SCAN_INTERVAL = timedelta(seconds=20)
+MIN_SCAN_INTERVAL = timedelta(seconds=1)
+SCHEDULE_POLL_OFFSETS: Final[tuple[timedelta, ...]] = (timedelta(seconds=2), timedelta(seconds=6))
+
+# Listeners are updated this many at a time after each refresh, yielding to the event loop in between, entities of these platforms first
+FAN_OUT_CHUNK_SIZE: Final[int] = 25
+FAN_OUT_PRIORITY_DOMAINS: Final[frozenset[str]] = frozenset({"light", "number", "switch", "valve", "water_heater"})
+
+# Regular polls of several config entries are spread over the idle interval, and at most this many controller requests are in flight
+# across all of them
+DATA_SCHEDULER: Final[str] = f"{DOMAIN}_scheduler"
+MAX_CONCURRENT_REQUESTS: Final[int] = 2
+
+# While a ColorLogic light is changing state we poll quickly so we can send any queued command as soon as it is ready
+LIGHT_TRANSITION_MAX_SCAN_INTERVAL = timedelta(seconds=5)
+LIGHT_PENDING_REQUEST_TIMEOUT = timedelta(minutes=2)
+
+# Sensor readings are only written once they move by at least the deadband and the minimum interval (seconds) has passed
+CONF_DEADBAND: Final[str] = "deadband"
+CONF_MIN_INTERVAL: Final[str] = "min_interval"
+SENSOR_KIND_TEMPERATURE: Final[str] = "temperature"
+SENSOR_KIND_SALT: Final[str] = "salt"
+SENSOR_KIND_PH: Final[str] = "ph"
+SENSOR_KIND_ORP: Final[str] = "orp"
+SENSOR_KIND_POWER: Final[str] = "power"
+SENSOR_KIND_ENERGY: Final[str] = "energy"
+SENSOR_KIND_RUNTIME: Final[str] = "runtime"
+DEFAULT_PUBLISH_POLICIES: Final[dict[str, tuple[float, int]]] = {
+    SENSOR_KIND_TEMPERATURE: (1, 60),
+    SENSOR_KIND_SALT: (10, 300),
+    SENSOR_KIND_PH: (0.1, 60),
+    SENSOR_KIND_ORP: (10, 60),
+    SENSOR_KIND_POWER: (25, 30),
+    SENSOR_KIND_ENERGY: (0.01, 60),
+    SENSOR_KIND_RUNTIME: (0.05, 60),
+}
+# A reading that settled within the deadband of the last written value is still written once this many seconds have passed
+PUBLISH_MAX_INTERVAL: Final[int] = 900
+
+# Energy and runtime are accumulated from every telemetry sample, gaps longer than this are skipped rather than guessed at
+MAX_SAMPLE_GAP = timedelta(minutes=5)
+ACCUMULATOR_SAVE_DELAY: Final[int] = 60
+
+# Rolling statistics are kept for the water chemistry readings over each of these windows
+ROLLING_WINDOWS: Final[dict[str, timedelta]] = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+}
+
+# Recordings of the controller traffic and profiling reports are written below this folder in the config directory
+RECORDING_DIR: Final[str] = "omnilogic_local"
+RECORDING_FLUSH_LINES: Final[int] = 50
+PROFILE_TOP_FUNCTIONS: Final[int] = 50
+PROFILE_TOP_ALLOCATIONS: Final[int] = 25
+# Set these environment variables to replay a recording instead of connecting to the controller
+ENV_REPLAY: Final[str] = "OMNILOGIC_LOCAL_REPLAY"
+ENV_REPLAY_SPEED: Final[str] = "OMNILOGIC_LOCAL_REPLAY_SPEED"
+# The ID of the config entry the recording replaces, every other entry keeps talking to its controller
+ENV_REPLAY_ENTRY: Final[str] = "OMNILOGIC_LOCAL_REPLAY_ENTRY"
+
+# Traces of the most recent commands are kept for diagnostics, a command not reflected in the state by the timeout is unconfirmed
+TRACE_HISTORY: Final[int] = 20
+TRACE_TIMEOUT = timedelta(minutes=1)
+
+# Static equipment metadata (system IDs, types, functions) can be left out of state attributes to slim down state payloads
+CONF_STATIC_ATTRIBUTES: Final[str] = "static_attributes"
+DEFAULT_STATIC_ATTRIBUTES: Final[bool] = True
+
+# Entity profiles, from smallest to largest. Each entity class belongs to the smallest profile that enables it, the next larger profile's
+# entities are added disabled and anything beyond that is not added at all
+CONF_ENTITY_PROFILE: Final[str] = "entity_profile"
+ENTITY_PROFILE_MINIMAL: Final[str] = "minimal"
+ENTITY_PROFILE_STANDARD: Final[str] = "standard"
+ENTITY_PROFILE_FULL: Final[str] = "full"
+ENTITY_PROFILES: Final[tuple[str, ...]] = (ENTITY_PROFILE_MINIMAL, ENTITY_PROFILE_STANDARD, ENTITY_PROFILE_FULL)
+DEFAULT_ENTITY_PROFILE: Final[str] = ENTITY_PROFILE_FULL
+
 # According to Hayward docs, the backyard always has a system id of 0
 BACKYARD_SYSTEM_ID: Final[int] = 0
 
@@ -18,6 +98,26 @@ MANUFACTURER: Final[str] = "Hayward"
 
 PUMP_SPEEDS: Final[list[str]] = ["low", "medium", "high"]
 
+# ColorLogic lights expose 4 brightness levels (0-4), Home Assistant uses 0-255
+BRIGHTNESS_SCALE: Final[tuple[int, int]] = (0, 4)
+
+SERVICE_APPLY_STATE: Final[str] = "apply_state"
+SERVICE_RECORD: Final[str] = "record"
+SERVICE_PROFILE: Final[str] = "profile"
+
+ATTR_CONFIG_ENTRY_ID: Final[str] = "config_entry_id"
+ATTR_ITEMS: Final[str] = "items"
+ATTR_SYSTEM_ID: Final[str] = "system_id"
+ATTR_STATE: Final[str] = "state"
+ATTR_SPEED: Final[str] = "speed"
+ATTR_SHOW: Final[str] = "show"
+ATTR_BRIGHTNESS: Final[str] = "brightness"
+ATTR_TEMPERATURE: Final[str] = "temperature"
+ATTR_SPILLOVER: Final[str] = "spillover"
+ATTR_DURATION: Final[str] = "duration"
+ATTR_CYCLES: Final[str] = "cycles"
+ATTR_TRACE_MEMORY: Final[str] = "trace_memory"
+
 OMNI_TO_HASS_TYPES: dict[str, str] = {
     OmniType.BACKYARD: "device",
     OmniType.BOW: "device",
@@ -27,6 +127,7 @@ OMNI_TO_HASS_TYPES: dict[str, str] = {
     OmniType.CSAD: "sensor",
     OmniType.CL_LIGHT: "light",
     OmniType.FILTER: "switch",
+    OmniType.GROUP: "switch",
     OmniType.HEATER: "water_heater",
     OmniType.HEATER_EQUIP: "water_heater",
     OmniType.PUMP: "switch",
@@ -35,3 +136,35 @@ OMNI_TO_HASS_TYPES: dict[str, str] = {
     OmniType.VALVE_ACTUATOR: "switch",
     OmniType.VIRT_HEATER: "water_heater",
 }
+
+# One config entry can serve its controller to other instances of the integration, see proxy.py
+CONF_PROXY: Final[str] = "proxy"
+CONF_PROXY_SERVER_PORT: Final[str] = "proxy_server_port"
+CONF_PROXY_SERVER_HOST: Final[str] = "proxy_server_host"
+# Shared by the owner and its clients, every proxy request must carry it
+CONF_PROXY_SECRET: Final[str] = "proxy_secret"
+# Only this machine can reach the proxy unless the owner chooses another address to listen on
+DEFAULT_PROXY_HOST: Final[str] = "127.0.0.1"
+DEFAULT_PROXY_PORT: Final[int] = 10445
+# Replies carry the full MSP config, which can be a few hundred KB on large installations
+PROXY_MAX_LINE: Final[int] = 4 * 1024 * 1024
+
+# Publish the telemetry changes to MQTT below this topic prefix, empty disables the bridge
+CONF_MQTT_PREFIX: Final[str] = "mqtt_prefix"
+# How many past telemetry snapshots are kept, so a consumer that missed refreshes still gets an exact diff
+SNAPSHOT_HISTORY: Final[int] = 10
+
+# Discovery probes this many hosts at once, each gets this long (seconds) to answer. Bigger subnets only have the /24 around
+# our own address scanned
+DISCOVERY_CONCURRENCY: Final[int] = 64
+DISCOVERY_TIMEOUT: Final[float] = 1.0
+DISCOVERY_MAX_HOSTS: Final[int] = 1024
+
+# Fired when a watched equipment field transitions between refreshes, also exposed as device triggers
+EVENT_EQUIPMENT: Final[str] = "omnilogic_local_equipment_event"
+CONF_SUBTYPE: Final[str] = "subtype"
+
+# Upper bounds (seconds) of the latency histogram buckets exposed to Prometheus
+METRICS_LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Event loop stalls are much shorter, a chunk of the fan-out should stay well below the 100 ms Home Assistant warns about
+METRICS_CHUNK_BUCKETS: Final[tuple[float, ...]] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
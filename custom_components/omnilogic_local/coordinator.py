@@ -3,15 +3,49 @@
 from __future__ import annotations
 
 import logging
+import time
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import SCAN_INTERVAL, UPDATE_DELAY_SECONDS
+from .const import (
+    CONF_ENTITY_PROFILE,
+    CONF_STATIC_ATTRIBUTES,
+    DEFAULT_ENTITY_PROFILE,
+    DEFAULT_STATIC_ATTRIBUTES,
+    IDLE_SCAN_INTERVAL,
+    SCAN_INTERVAL,
+    UPDATE_DELAY_SECONDS,
+)
+from .energy import EnergyMeter
+from .events import TransitionDetector
+from .fanout import ChunkedFanOut
+from .light_tracker import ColorLogicLightTracker, async_send_light_request
+from .metrics import IntegrationMetrics
+from .polling import next_poll_interval, schedule_transitions
+from .publish_policy import publish_policies_from_options
+from .runtime import RuntimeTracker
+from .scheduling import async_get_scheduler
+from .snapshot import TelemetrySnapshots
+from .stats import ChemistryStats
+from .tracing import CommandTracer
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
-    from pyomnilogic_local import OmniLogic
+    from pyomnilogic_local import ColorLogicLight, OmniLogic
+
+    from .light_tracker import PendingLightRequest
+    from .profiling import CycleProfiler
+    from .proxy import OmniLogicProxyServer
+    from .publish_policy import PublishPolicy
+    from .recording import TelemetryRecorder
+    from .scheduling import PollScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,31 +58,183 @@ class OmniLogicCoordinator(DataUpdateCoordinator[None]):
     # We don't need to store the data inside of the coordinator
     data: None
 
-    failure_counts: dict[str, int] = {}
+    failure_counts: dict[str, int]
+    schedule_transitions: list[datetime]
+    light_trackers: dict[int, ColorLogicLightTracker]
+    publish_policies: dict[str, PublishPolicy]
+    static_attributes: bool
+    energy: EnergyMeter
+    runtime: RuntimeTracker
+    chemistry: ChemistryStats
+    recording: TelemetryRecorder | None
+    profiler: CycleProfiler | None
+    tracer: CommandTracer
+    metrics: IntegrationMetrics
+    proxy_server: OmniLogicProxyServer | None
+    snapshots: TelemetrySnapshots
+    transitions: TransitionDetector
+    # How many entity state writes were skipped because the change was not significant
+    suppressed_writes: int
+    entity_profile: str
+    # The smallest profile enabling each entity, keyed by platform and unique ID, filled in as the platforms set up
+    entity_profiles: dict[tuple[str, str], str]
+    fan_out: ChunkedFanOut
+    # How long the listeners (mostly entities) took to handle the latest refresh
+    fan_out_seconds: float
+    scheduler: PollScheduler
+    # How late the latest scheduled poll started, in seconds
+    poll_delay: float
+    _planned_poll: float | None
+    # Refreshes are driven by a recording instead of the poll timer, see recording.async_replay
+    replaying: bool
 
-    def __init__(self, hass: HomeAssistant, omni: OmniLogic) -> None:
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, omni: OmniLogic, replaying: bool = False) -> None:
         """Initialize my coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             # Name of the data. For logging purposes.
             name="OmniLogic",
             # Polling interval. Will only be polled if there are subscribers.
-            update_interval=SCAN_INTERVAL,
+            update_interval=None if replaying else SCAN_INTERVAL,
         )
+        self.replaying = replaying
         self.omni = omni
+        self.failure_counts = {}
+        self.schedule_transitions = []
+        self.light_trackers = {}
+        self.publish_policies = publish_policies_from_options(config_entry.options)
+        self.static_attributes = config_entry.options.get(CONF_STATIC_ATTRIBUTES, DEFAULT_STATIC_ATTRIBUTES)
+        self.suppressed_writes = 0
+        self.entity_profile = config_entry.options.get(CONF_ENTITY_PROFILE, DEFAULT_ENTITY_PROFILE)
+        self.entity_profiles = {}
+        self.fan_out = ChunkedFanOut(hass)
+        self.fan_out_seconds = 0.0
+        self.scheduler = async_get_scheduler(hass)
+        self.poll_delay = 0.0
+        self._planned_poll = None
+        self.energy = EnergyMeter(hass, config_entry.entry_id, persist=not replaying)
+        self.runtime = RuntimeTracker(hass, config_entry.entry_id, persist=not replaying)
+        self.chemistry = ChemistryStats()
+        self.recording = None
+        self.profiler = None
+        self.tracer = CommandTracer()
+        self.metrics = IntegrationMetrics()
+        self.proxy_server = None
+        self.snapshots = TelemetrySnapshots(omni)
+        self.transitions = TransitionDetector(hass)
 
     async def _async_update_data(self) -> None:
         """Update data via library."""
+        if self.profiler is not None:
+            try:
+                self.profiler.start_cycle()
+            except ValueError as err:
+                # Only one profiler can run at a time, give up on the profile rather than failing the refresh
+                _LOGGER.error("Stopped profiling to %s: %s", self.profiler.path, err)
+                self.profiler = None
+        # Refreshes requested after a command come before the planned poll, only a scheduled poll can be late
+        if self._planned_poll is not None and (delay := self.hass.loop.time() - self._planned_poll) >= 0:
+            self.poll_delay = delay
+            self.metrics.poll_delay.observe(delay)
+        self._planned_poll = None
+        self.tracer.on_refresh_start()
+        start = time.monotonic()
         try:
             # This ensures that telemetry is updated on every refresh
             # The MSP Config will be refreshed if the stored config checksum doesn't match the
             # config checksum in the telemetry.
             await self.omni.refresh(force_telemetry=True)
         except Exception as err:
+            self.metrics.refresh_latency.observe(time.monotonic() - start)
             err_name = type(err).__name__
             self.failure_counts[err_name] = self.failure_counts.get(err_name, 0) + 1
+            if not self.replaying:
+                self.update_interval = SCAN_INTERVAL
+            self._end_profile_cycle()
             raise UpdateFailed("Failed to update data from OmniLogic") from err
+        self.metrics.refresh_latency.observe(time.monotonic() - start)
+        self.energy.sample(self.omni)
+        self.runtime.sample(self.omni)
+        self.chemistry.sample(self.omni)
+        self.transitions.detect(self.omni)
+        self.tracer.on_refresh_end()
+        if self.replaying:
+            # Still feed the light trackers, but leave the timer off so every cycle is fed once, by the replay
+            self._update_light_trackers()
+        else:
+            self._plan_next_poll()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, in chunks so a large install doesn't stall the event loop."""
+        self.fan_out.start(self._listeners, self._fan_out_done)
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        self.fan_out.cancel()
+
+    @callback
+    def _fan_out_done(self) -> None:
+        self.fan_out_seconds = self.fan_out.total_seconds
+        self.metrics.fan_out_chunk.observe(self.fan_out.max_chunk_seconds)
+        # Fire the transition events once the entities show the new state, so automations triggered by them see it too
+        self.transitions.fire_pending()
+        # A profiled cycle includes every entity handling the update and writing its state
+        self._end_profile_cycle()
+
+    def _end_profile_cycle(self) -> None:
+        if self.profiler is not None and self.profiler.end_cycle():
+            profiler, self.profiler = self.profiler, None
+            self.config_entry.async_create_background_task(self.hass, profiler.async_finish(), "omnilogic_local profile report")
+
+    def _plan_next_poll(self) -> None:
+        """Time the next poll around the upcoming schedule transitions."""
+        now = dt_util.now()
+        self.schedule_transitions = schedule_transitions(self.omni.schedules.values(), now)
+        self.update_interval = next_poll_interval(self.schedule_transitions, now)
+        for interval in self._update_light_trackers():
+            self.update_interval = min(self.update_interval, interval)
+        # DataUpdateCoordinator schedules the next refresh from the current whole second plus its random jitter
+        base = int(self.hass.loop.time()) + self._microsecond
+        if self.update_interval == IDLE_SCAN_INTERVAL:
+            # Nothing needs a poll at a particular time, take this entry's slot to stay clear of the other controllers' polls
+            slot = self.scheduler.next_slot(self.config_entry.entry_id, base, self.update_interval)
+            self.update_interval = timedelta(seconds=slot - base)
+        self._planned_poll = base + self.update_interval.total_seconds()
+        _LOGGER.debug("Next poll in %s, upcoming schedule transitions: %s", self.update_interval, self.schedule_transitions[:2])
+
+    def light_tracker(self, system_id: int) -> ColorLogicLightTracker:
+        """Return the power state tracker for a light, creating it if needed."""
+        if system_id not in self.light_trackers:
+            self.light_trackers[system_id] = ColorLogicLightTracker(system_id)
+        return self.light_trackers[system_id]
+
+    def _update_light_trackers(self) -> list[timedelta]:
+        """Feed the latest telemetry to the light trackers, send any queued commands and return their requested poll intervals."""
+        intervals: list[timedelta] = []
+        for system_id, tracker in self.light_trackers.items():
+            light: ColorLogicLight | None = self.omni.get_equipment_by_id(system_id)
+            if light is None:
+                continue
+            tracker.observe(light)
+            if (request := tracker.pop_ready_request(light)) is not None:
+                self.config_entry.async_create_background_task(
+                    self.hass, self._async_send_light_request(light, request), f"omnilogic_local light {system_id} pending request"
+                )
+            if (interval := tracker.poll_interval()) is not None:
+                intervals.append(interval)
+        return intervals
+
+    async def _async_send_light_request(self, light: ColorLogicLight, request: PendingLightRequest) -> None:
+        _LOGGER.debug("Light %s is ready, sending queued request %s", light.system_id, request)
+        try:
+            await async_send_light_request(light, request)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Failed to send queued request to light %s", light.name)
+            return
+        self.do_next_refresh_after()
 
     def do_next_refresh_after(self, delay: float = UPDATE_DELAY_SECONDS) -> None:
         """Delay the next refresh by a given number of seconds."""
@@ -0,0 +1,73 @@
+"""Device triggers for equipment transitions on the backyard and body of water devices."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.homeassistant.triggers import event as event_trigger
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_EVENT_DATA, CONF_PLATFORM, CONF_TYPE
+from homeassistant.helpers import device_registry as dr
+
+from .const import CONF_SUBTYPE, DOMAIN, EVENT_EQUIPMENT, KEY_COORDINATOR
+from .events import TRIGGER_TYPES, device_identifier, watched_equipment
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+    from homeassistant.helpers.typing import ConfigType
+
+    from .coordinator import OmniLogicCoordinator
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+        # The name of the piece of equipment on the device
+        vol.Required(CONF_SUBTYPE): str,
+    }
+)
+
+
+async def async_get_triggers(hass: HomeAssistant, device_id: str) -> list[dict[str, Any]]:
+    """List the transition triggers for the equipment on a backyard or body of water device."""
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        return []
+    identifiers = {identifier for domain, identifier in device.identifiers if domain == DOMAIN}
+    triggers: list[dict[str, Any]] = []
+    for entry_id in device.config_entries:
+        if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+            continue
+        coordinator: OmniLogicCoordinator = entry_data[KEY_COORDINATOR]
+        for equipment, watched in watched_equipment(coordinator.omni):
+            if device_identifier(equipment) not in identifiers:
+                continue
+            triggers.extend(
+                {
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: rule.event_type,
+                    CONF_SUBTYPE: equipment.name,
+                }
+                for rule in watched.rules
+            )
+    return triggers
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant, config: ConfigType, action: TriggerActionType, trigger_info: TriggerInfo
+) -> CALLBACK_TYPE:
+    """Listen for the equipment event matching the trigger."""
+    event_config = event_trigger.TRIGGER_SCHEMA(
+        {
+            CONF_PLATFORM: "event",
+            event_trigger.CONF_EVENT_TYPE: EVENT_EQUIPMENT,
+            CONF_EVENT_DATA: {
+                CONF_DEVICE_ID: config[CONF_DEVICE_ID],
+                CONF_TYPE: config[CONF_TYPE],
+                "name": config[CONF_SUBTYPE],
+            },
+        }
+    )
+    return await event_trigger.async_attach_trigger(hass, event_config, action, trigger_info, platform_type="device")
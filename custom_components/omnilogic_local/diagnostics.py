@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
 
-from .const import DOMAIN, KEY_COORDINATOR
+from .const import CONF_PROXY_SECRET, DOMAIN, KEY_COORDINATOR
+from .entity_profile import profile_footprints
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -26,6 +27,22 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry:
         diag["msp_config"] = coordinator.omni.mspconfig._raw
         diag["telemetry"] = coordinator.omni.telemetry._raw
         diag["failure_counts"] = coordinator.failure_counts
-
-    # There are no credentials or other secrets within the diagnostic data for this integration
-    return async_redact_data(diag, [])
+        diag["update_interval"] = str(coordinator.update_interval)
+        diag["suppressed_writes"] = coordinator.suppressed_writes
+        diag["schedule_transitions"] = [transition.isoformat() for transition in coordinator.schedule_transitions]
+        diag["command_traces"] = coordinator.tracer.as_dicts()
+        diag["scheduling"] = {
+            "poll_phase": coordinator.scheduler.phase(config_entry.entry_id),
+            "last_poll_delay": coordinator.poll_delay,
+            "entries": len(coordinator.scheduler.entry_ids),
+        }
+        diag["fan_out"] = {
+            "seconds": coordinator.fan_out.total_seconds,
+            "max_chunk_seconds": coordinator.fan_out.max_chunk_seconds,
+        }
+        diag["entity_profile"] = coordinator.entity_profile
+        diag["entity_footprints"] = profile_footprints(coordinator)
+        diag["proxy_clients"] = coordinator.proxy_server.clients if coordinator.proxy_server is not None else None
+
+    # The proxy secret is the only credential in the diagnostic data for this integration
+    return async_redact_data(diag, [CONF_PROXY_SECRET])
@@ -0,0 +1,115 @@
+"""Find OmniLogic controllers on the local network by asking every host on the local subnets for its telemetry."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.components import network
+from homeassistant.helpers.device_registry import format_mac
+from pyomnilogic_local.api.api import OmniLogicAPI
+
+from .const import DEFAULT_PORT, DISCOVERY_CONCURRENCY, DISCOVERY_MAX_HOSTS, DISCOVERY_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+    from pyomnilogic_local.models.telemetry import Telemetry
+
+_LOGGER = logging.getLogger(__name__)
+
+# The kernel's neighbour table, populated with the controller's MAC address once it has answered us
+ARP_TABLE = Path("/proc/net/arp")
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredController:
+    host: str
+    port: int
+    msp_version: str | None
+    # The controller's MAC address when the neighbour table knows it, the host and port otherwise
+    unique_id: str
+
+
+def read_mac_address(host: str) -> str | None:
+    """Look up the MAC address of a host on the local network in the neighbour table, this does blocking I/O."""
+    try:
+        lines = ARP_TABLE.read_text(encoding="ascii").splitlines()[1:]
+    except OSError:
+        # Not Linux, or no access to procfs
+        return None
+    for line in lines:
+        # IP address, HW type, Flags, HW address, Mask, Device
+        fields = line.split()
+        if len(fields) >= 4 and fields[0] == host and fields[3] != "00:00:00:00:00:00":
+            return format_mac(fields[3])
+    return None
+
+
+async def async_controller_unique_id(hass: HomeAssistant, host: str) -> str | None:
+    """Return a unique ID for the controller at `host` that survives it getting a new IP address, if one can be found."""
+    return await hass.async_add_executor_job(read_mac_address, host)
+
+
+def address_unique_id(host: str, port: int) -> str:
+    """Return the unique ID used for a controller whose MAC address can't be found, the same however it was added."""
+    return f"{host}:{port}"
+
+
+def scan_networks(adapters: Iterable[network.Adapter]) -> list[ipaddress.IPv4Network]:
+    """Return the IPv4 networks of the enabled adapters, narrowed to the /24 around our address when they are too big to scan."""
+    networks: list[ipaddress.IPv4Network] = []
+    for adapter in adapters:
+        if not adapter["enabled"]:
+            continue
+        for address in adapter["ipv4"]:
+            interface = ipaddress.IPv4Interface(f"{address['address']}/{address['network_prefix']}")
+            if interface.is_loopback or interface.is_link_local:
+                continue
+            net = interface.network
+            if net.num_addresses > DISCOVERY_MAX_HOSTS:
+                net = ipaddress.IPv4Interface(f"{address['address']}/24").network
+            if net not in networks:
+                networks.append(net)
+    return networks
+
+
+async def async_probe(host: str, port: int, response_timeout: float) -> Telemetry | None:
+    """Return the telemetry of the OmniLogic controller at `host`, or None when nothing there answers."""
+    api = OmniLogicAPI(host, port, response_timeout)
+    try:
+        # Telemetry is the smallest response every controller sends, the library retransmits on its own so bound the whole exchange
+        async with asyncio.timeout(response_timeout):
+            telemetry = await api.async_get_telemetry()
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return telemetry
+
+
+async def async_discover(
+    hass: HomeAssistant, networks: list[ipaddress.IPv4Network] | None = None, port: int = DEFAULT_PORT
+) -> list[DiscoveredController]:
+    """Probe every host of `networks` (the local subnets by default) concurrently and return the controllers that answered."""
+    if networks is None:
+        networks = scan_networks(await network.async_get_adapters(hass))
+    hosts = list(dict.fromkeys(str(host) for net in networks for host in net.hosts()))
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def probe(host: str) -> DiscoveredController | None:
+        async with semaphore:
+            telemetry = await async_probe(host, port, DISCOVERY_TIMEOUT)
+        if telemetry is None:
+            return None
+        unique_id = await async_controller_unique_id(hass, host) or address_unique_id(host, port)
+        return DiscoveredController(host, port, telemetry.backyard.msp_version, unique_id)
+
+    _LOGGER.debug("Probing %d hosts on %s for OmniLogic controllers", len(hosts), ", ".join(map(str, networks)))
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    controllers = [controller for controller in results if controller is not None]
+    _LOGGER.debug("Found OmniLogic controllers: %s", controllers)
+    return controllers
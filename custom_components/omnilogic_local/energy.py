@@ -0,0 +1,102 @@
+"""Accumulate energy usage from the power readings reported in telemetry."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, TypedDict
+
+from homeassistant.helpers.storage import Store
+from pyomnilogic_local.omnitypes import FilterState
+
+from .const import ACCUMULATOR_SAVE_DELAY, DOMAIN, MAX_SAMPLE_GAP
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pyomnilogic_local import Filter, OmniLogic
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# The filter only reports meaningful power while it is in one of these states, otherwise it is not drawing any power
+FILTER_RUNNING_STATES = (
+    FilterState.ON,
+    FilterState.PRIMING,
+    FilterState.HEATER_EXTEND,
+    FilterState.CSAD_EXTEND,
+    FilterState.FILTER_FORCE_PRIMING,
+    FilterState.FILTER_SUPERCHLORINATE,
+)
+
+
+class EnergyStoreData(TypedDict):
+    # Keys are system IDs as strings, JSON does not allow integer keys
+    totals: dict[str, float]
+
+
+def filter_power(filt: Filter) -> int:
+    """Return the power draw of a filter in watts."""
+    return filt.power if filt.state in FILTER_RUNNING_STATES else 0
+
+
+class EnergyMeter:
+    """Integrate the power reported by each filter into a running kWh total that survives restarts.
+
+    Every telemetry sample is integrated, regardless of whether the power sensor wrote it to the state machine, using the trapezoidal
+    rule between consecutive samples. Gaps longer than MAX_SAMPLE_GAP (for example while the controller was unreachable) are
+    skipped rather than guessed at.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, persist: bool = True) -> None:
+        self._store: Store[EnergyStoreData] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.energy")
+        self.totals: dict[int, float] = {}
+        self._last_sample: dict[int, tuple[float, int]] = {}
+        # Store pushes a pending write back every time it is asked to save, asking on every poll would mean it never lands
+        self._save_pending = False
+        # Replays keep their totals in memory, they must not overwrite the ones stored for the real controller
+        self._persist = persist
+
+    async def async_load(self) -> None:
+        """Restore the running totals from storage."""
+        if not self._persist:
+            return
+        if (data := await self._store.async_load()) is not None:
+            self.totals = {int(system_id): total for system_id, total in data["totals"].items()}
+
+    def sample(self, omni: OmniLogic) -> None:
+        """Add the energy used since the previous sample for every piece of equipment that reports its power."""
+        now = time.monotonic()
+        for _, _, filt in omni.all_filters.items():
+            if filt.system_id is None:
+                continue
+            self._integrate(filt.system_id, filter_power(filt), now)
+        if self._persist and not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, ACCUMULATOR_SAVE_DELAY)
+
+    def _integrate(self, system_id: int, watts: int, now: float) -> None:
+        total = self.totals.setdefault(system_id, 0.0)
+        if (last := self._last_sample.get(system_id)) is not None:
+            last_time, last_watts = last
+            elapsed = now - last_time
+            if elapsed <= MAX_SAMPLE_GAP.total_seconds():
+                # Watt-seconds to kWh
+                self.totals[system_id] = total + (last_watts + watts) / 2 * elapsed / 3_600_000
+            else:
+                _LOGGER.debug("Skipping %.0f second gap in power samples for system ID %s", elapsed, system_id)
+        self._last_sample[system_id] = (now, watts)
+
+    def _data_to_save(self) -> EnergyStoreData:
+        self._save_pending = False
+        return {"totals": {str(system_id): total for system_id, total in self.totals.items()}}
+
+    async def async_save(self) -> None:
+        """Write the running totals to storage immediately, used when the integration is unloaded."""
+        if not self._persist:
+            return
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the stored running totals, used when the config entry is removed."""
+        await self._store.async_remove()
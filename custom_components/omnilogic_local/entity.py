@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast
+from functools import wraps
+from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -24,9 +25,12 @@ from pyomnilogic_local import (
     Sensor,
 )
 
-from .const import BACKYARD_SYSTEM_ID, DOMAIN, MANUFACTURER
+from .const import BACKYARD_SYSTEM_ID, DOMAIN, ENTITY_PROFILE_MINIMAL, MANUFACTURER
 from .coordinator import OmniLogicCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 _LOGGER = logging.getLogger(__name__)
 
 type OmnilogicEquipment = (
@@ -48,8 +52,49 @@ type OmnilogicEquipment = (
 )
 
 
+def cycle_cached[E: OmniLogicEntity[Any], T](func: Callable[[E], T]) -> Callable[[E], T]:
+    """Cache a derived property until the coordinator's next update, apply it below @property.
+
+    Home Assistant reads state, icon, availability and attributes several times for every state write, only the first read of each
+    refresh does the work.
+    """
+    # Qualified so a subclass calling super() on a cached property doesn't read back its own value
+    key = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self: E) -> T:
+        try:
+            return self._cycle_cache[key]
+        except KeyError:
+            value = self._cycle_cache[key] = func(self)
+            return value
+
+    return wrapper
+
+
+def config_cached[E: OmniLogicEntity[Any], T](func: Callable[[E], T]) -> Callable[[E], T]:
+    """Cache a property derived only from the MSP config until the controller reports a new config checksum, apply it below @property."""
+    key = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self: E) -> T:
+        checksum = self.coordinator.omni.telemetry.backyard.config_checksum
+        cached = self._config_cache.get(key)
+        if cached is not None and cached[0] == checksum:
+            return cached[1]
+        value = func(self)
+        self._config_cache[key] = (checksum, value)
+        return value
+
+    return wrapper
+
+
 class OmniLogicEntity[EquipmentTypes: OmnilogicEquipment](CoordinatorEntity[OmniLogicCoordinator]):
     _attr_has_entity_name = True
+    # Home Assistant does not merge this with parent classes, subclasses must extend OmniLogicEntity._unrecorded_attributes
+    _unrecorded_attributes = frozenset({"omni_system_id", "omni_bow_id"})
+    # The smallest entity profile this entity is enabled in, see entity_profile.py
+    entity_profile: str = ENTITY_PROFILE_MINIMAL
 
     equipment: EquipmentTypes
     coordinator: OmniLogicCoordinator
@@ -63,21 +108,35 @@ class OmniLogicEntity[EquipmentTypes: OmnilogicEquipment](CoordinatorEntity[Omni
         self.equipment = equipment
         self.bow_id = equipment.bow_id
         self.system_id = equipment.system_id
+        # Memoized properties, see cycle_cached and config_cached
+        self._cycle_cache: dict[str, Any] = {}
+        self._config_cache: dict[str, tuple[int, Any]] = {}
         subclass_name = self.__class__.__name__
         _LOGGER.debug("Configuring %s for %s - SystemID: %s, Name: %s", subclass_name, equipment.omni_type, self.system_id, equipment.name)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._cycle_cache.clear()
         if self.system_id is not None:
             subclass_name = self.__class__.__name__
             _LOGGER.debug(
                 "Updating %s for %s - SystemID: %s, Name: %s", subclass_name, self.equipment.omni_type, self.system_id, self.equipment.name
             )
             self.equipment = cast("EquipmentTypes", self.coordinator.omni.get_equipment_by_id(self.system_id))
+        if not self._should_write_state():
+            self.coordinator.suppressed_writes += 1
+            return
         self.async_write_ha_state()
+        if self.coordinator.tracer.open:
+            self.coordinator.tracer.on_state_written(self)
+
+    def _should_write_state(self) -> bool:
+        """Return whether this update is worth writing to the state machine, entities can override this to filter out noise."""
+        return True
 
     @property
+    @cycle_cached
     def available(self) -> bool:
         # By default we consider an entity available if the backyard is ready (not in service mode),
         # Individual entities can override this if needed.
@@ -101,12 +160,19 @@ class OmniLogicEntity[EquipmentTypes: OmnilogicEquipment](CoordinatorEntity[Omni
         return {}
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        base_attributes: dict[str, Any] = {
+    @config_cached
+    def _static_state_attributes(self) -> dict[str, Any]:
+        """Attributes describing the equipment itself, which never change while the MSP config stays the same."""
+        return {
             "omni_system_id": self.system_id,
             "omni_bow_id": self.bow_id,
         }
-        return self._extra_state_attributes | base_attributes
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        if not self.coordinator.static_attributes:
+            return self._extra_state_attributes
+        return self._extra_state_attributes | self._static_state_attributes
 
     @property
     def name(self) -> Any:
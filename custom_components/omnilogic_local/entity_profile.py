@@ -0,0 +1,78 @@
+"""Entity profiles decide which entity classes are added, and which of those are enabled by default.
+
+Every entity class names the smallest profile it is enabled in (OmniLogicEntity.entity_profile). Under a profile its own and smaller
+profiles' entities are enabled, the next larger profile's entities are added disabled so they can still be enabled one at a time, and
+anything larger is not added at all, which keeps big installs from carrying hundreds of entities nobody looks at.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, ENTITY_PROFILES
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import OmniLogicCoordinator
+    from .entity import OmniLogicEntity
+
+
+def apply_entity_profile[E: OmniLogicEntity[Any]](coordinator: OmniLogicCoordinator, entities: list[E]) -> list[E]:
+    """Return the entities to add under the configured profile, and record every entity's profile on the coordinator."""
+    domain = entity_platform.async_get_current_platform().domain
+    registry = er.async_get(coordinator.hass)
+    profile_rank = ENTITY_PROFILES.index(coordinator.entity_profile)
+    added: list[E] = []
+    for entity in entities:
+        # Entities disabled by default regardless of the profile are neither counted nor touched when the profile changes
+        if entity.entity_registry_enabled_default and entity.unique_id is not None:
+            coordinator.entity_profiles[(domain, entity.unique_id)] = entity.entity_profile
+        rank = ENTITY_PROFILES.index(entity.entity_profile)
+        if rank > profile_rank + 1:
+            # Don't leave a previously added entity behind as unavailable
+            if entity.unique_id is not None and (entity_id := registry.async_get_entity_id(domain, DOMAIN, entity.unique_id)):
+                registry.async_remove(entity_id)
+            continue
+        if rank > profile_rank:
+            entity._attr_entity_registry_enabled_default = False
+        added.append(entity)
+    return added
+
+
+def async_reconcile_entity_registry(hass: HomeAssistant, coordinator: OmniLogicCoordinator, profile: str) -> None:
+    """Enable and disable the registered entities to match a newly selected profile.
+
+    The enabled by default flag only applies when an entity is first registered, so entities that already exist are updated here. Only
+    entities we disabled ourselves are enabled again, and only the ones a smaller profile leaves out are disabled.
+    """
+    registry = er.async_get(hass)
+    profile_rank = ENTITY_PROFILES.index(profile)
+    for (domain, unique_id), entity_profile in coordinator.entity_profiles.items():
+        entity_id = registry.async_get_entity_id(domain, DOMAIN, unique_id)
+        if entity_id is None or (entry := registry.async_get(entity_id)) is None:
+            continue
+        rank = ENTITY_PROFILES.index(entity_profile)
+        if rank <= profile_rank and entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            registry.async_update_entity(entity_id, disabled_by=None)
+        elif rank > profile_rank and entry.disabled_by is None:
+            registry.async_update_entity(entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION)
+
+
+def profile_footprints(coordinator: OmniLogicCoordinator) -> dict[str, dict[str, Any]]:
+    """Return how many entities each profile enables, and the estimated time they take to handle each refresh.
+
+    The cost is the average time an enabled entity took to handle the latest refresh, multiplied by the number of entities.
+    """
+    listeners = len(coordinator._listeners)
+    per_entity = coordinator.fan_out_seconds / listeners if listeners else 0.0
+    footprints: dict[str, dict[str, Any]] = {}
+    for profile_rank, profile in enumerate(ENTITY_PROFILES):
+        entities = sum(
+            1 for entity_profile in coordinator.entity_profiles.values() if ENTITY_PROFILES.index(entity_profile) <= profile_rank
+        )
+        footprints[profile] = {"entities": entities, "cycle_ms": round(entities * per_entity * 1000, 2)}
+    return footprints
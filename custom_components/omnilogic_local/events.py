@@ -0,0 +1,191 @@
+"""Fire an event whenever a watched telemetry field of a piece of equipment transitions between refreshes."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers import device_registry as dr
+from pyomnilogic_local import Bow
+from pyomnilogic_local.omnitypes import BackyardState, ColorLogicPowerState, FilterState, HeaterState, PumpState
+
+from .const import BACKYARD_SYSTEM_ID, DOMAIN, EVENT_EQUIPMENT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from homeassistant.core import HomeAssistant
+    from pyomnilogic_local import OmniLogic
+
+    from .entity import OmnilogicEquipment
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_MODES = (BackyardState.SERVICE_MODE, BackyardState.CONFIG_MODE, BackyardState.TIMED_SERVICE_MODE)
+FILTER_PRIMING = (FilterState.PRIMING, FilterState.FILTER_FORCE_PRIMING)
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionRule:
+    event_type: str
+    # Called with the previous and current value of the field, True when the transition is this event
+    matches: Callable[[Any, Any], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class WatchedField:
+    equipment: Callable[[OmniLogic], Iterable[OmnilogicEquipment]]
+    field: str
+    value: Callable[[Any], Any]
+    rules: tuple[TransitionRule, ...]
+
+
+def _started(old: Any, new: Any) -> bool:
+    return bool(not old and new)
+
+
+def _stopped(old: Any, new: Any) -> bool:
+    return bool(old and not new)
+
+
+WATCHED_FIELDS: tuple[WatchedField, ...] = (
+    WatchedField(
+        lambda omni: [omni.backyard],
+        "state",
+        lambda backyard: backyard.state,
+        (
+            TransitionRule("service_mode_started", lambda old, new: old not in SERVICE_MODES and new in SERVICE_MODES),
+            TransitionRule("service_mode_ended", lambda old, new: old in SERVICE_MODES and new not in SERVICE_MODES),
+        ),
+    ),
+    WatchedField(
+        lambda omni: omni.all_bows.values(),
+        "flow",
+        lambda bow: bow.flow,
+        (TransitionRule("flow_lost", _stopped), TransitionRule("flow_restored", _started)),
+    ),
+    WatchedField(
+        lambda omni: omni.all_filters.values(),
+        "state",
+        lambda filt: filt.state,
+        (
+            TransitionRule("filter_started", lambda old, new: old == FilterState.OFF and new != FilterState.OFF),
+            TransitionRule("filter_stopped", lambda old, new: old != FilterState.OFF and new == FilterState.OFF),
+            TransitionRule("filter_priming", lambda old, new: old not in FILTER_PRIMING and new in FILTER_PRIMING),
+        ),
+    ),
+    WatchedField(
+        lambda omni: omni.all_pumps.values(),
+        "state",
+        lambda pump: pump.state,
+        (
+            TransitionRule("pump_started", lambda old, new: old == PumpState.OFF and new != PumpState.OFF),
+            TransitionRule("pump_stopped", lambda old, new: old != PumpState.OFF and new == PumpState.OFF),
+            TransitionRule("pump_priming", lambda old, new: old != PumpState.PRIMING and new == PumpState.PRIMING),
+        ),
+    ),
+    WatchedField(
+        lambda omni: omni.all_lights.values(),
+        "state",
+        lambda light: light.state,
+        (
+            TransitionRule("light_on", lambda old, new: old != ColorLogicPowerState.ACTIVE and new == ColorLogicPowerState.ACTIVE),
+            TransitionRule("light_off", lambda old, new: old != ColorLogicPowerState.OFF and new == ColorLogicPowerState.OFF),
+            TransitionRule(
+                "light_cooldown_finished", lambda old, new: old == ColorLogicPowerState.COOLDOWN and new != ColorLogicPowerState.COOLDOWN
+            ),
+        ),
+    ),
+    WatchedField(
+        lambda omni: omni.all_heater_equipment.values(),
+        "state",
+        lambda heater: heater.state,
+        (
+            TransitionRule("heater_heating_started", lambda old, new: old != HeaterState.ON and new == HeaterState.ON),
+            TransitionRule("heater_heating_stopped", lambda old, new: old == HeaterState.ON and new != HeaterState.ON),
+        ),
+    ),
+    WatchedField(
+        lambda omni: omni.all_chlorinators.values(),
+        "generating",
+        lambda chlorinator: chlorinator.is_generating,
+        (TransitionRule("chlorinator_generating_started", _started), TransitionRule("chlorinator_generating_stopped", _stopped)),
+    ),
+)
+
+TRIGGER_TYPES: frozenset[str] = frozenset(rule.event_type for watched in WATCHED_FIELDS for rule in watched.rules)
+
+
+def device_identifier(equipment: OmnilogicEquipment) -> str:
+    """Return the identifier of the backyard or body of water device the equipment's triggers belong to."""
+    if isinstance(equipment, Bow):
+        return f"bow_{equipment.system_id}"
+    # Backyard level equipment has a BOW ID of -1, the same check OmniLogicEntity.device_info makes
+    if equipment.bow_id is not None and equipment.bow_id != -1:
+        return f"bow_{equipment.bow_id}"
+    return f"backyard_{BACKYARD_SYSTEM_ID}"
+
+
+def watched_equipment(omni: OmniLogic) -> Iterator[tuple[OmnilogicEquipment, WatchedField]]:
+    for watched in WATCHED_FIELDS:
+        for equipment in watched.equipment(omni):
+            yield equipment, watched
+
+
+def _serialize(value: Any) -> Any:
+    return value.name if isinstance(value, Enum) else value
+
+
+class TransitionDetector:
+    """Remembers the watched fields from the last refresh and fires an event for every transition matching a rule.
+
+    Transitions are detected as each refresh arrives, so none are lost when refreshes come faster than the entities are updated, and
+    fired later by `fire_pending`.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._previous: dict[tuple[int, str], Any] = {}
+        self._device_ids: dict[str, str | None] = {}
+        self._pending: list[tuple[OmnilogicEquipment, str, str, Any, Any]] = []
+
+    def detect(self, omni: OmniLogic) -> None:
+        current: dict[tuple[int, str], Any] = {}
+        for equipment, watched in watched_equipment(omni):
+            if equipment.system_id is None:
+                continue
+            key = (equipment.system_id, watched.field)
+            new = current[key] = watched.value(equipment)
+            # Equipment seen for the first time (startup, or added to the MSP config) has nothing to transition from
+            if key not in self._previous or (old := self._previous[key]) == new:
+                continue
+            for rule in watched.rules:
+                if rule.matches(old, new):
+                    self._pending.append((equipment, watched.field, rule.event_type, old, new))
+        self._previous = current
+
+    def fire_pending(self) -> None:
+        """Fire the events for every transition detected since the last call, oldest first."""
+        pending, self._pending = self._pending, []
+        for transition in pending:
+            self._fire(*transition)
+
+    def _fire(self, equipment: OmnilogicEquipment, field: str, event_type: str, old: Any, new: Any) -> None:
+        identifier = device_identifier(equipment)
+        if identifier not in self._device_ids:
+            device = dr.async_get(self.hass).async_get_device(identifiers={(DOMAIN, identifier)})
+            self._device_ids[identifier] = device.id if device is not None else None
+        data = {
+            "device_id": self._device_ids[identifier],
+            "type": event_type,
+            "system_id": equipment.system_id,
+            "name": equipment.name,
+            "omni_type": equipment.omni_type,
+            "field": field,
+            "from": _serialize(old),
+            "to": _serialize(new),
+        }
+        _LOGGER.debug("Firing %s: %s", EVENT_EQUIPMENT, data)
+        self.hass.bus.async_fire(EVENT_EQUIPMENT, data)
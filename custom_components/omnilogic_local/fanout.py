@@ -0,0 +1,95 @@
+"""Hand a refresh to the coordinator's listeners in chunks, yielding to the event loop between chunks."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import FAN_OUT_CHUNK_SIZE, FAN_OUT_PRIORITY_DOMAINS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+type Listeners = dict[int, tuple[CALLBACK_TYPE, object | None]]
+
+
+def listener_priority(update_callback: CALLBACK_TYPE) -> int:
+    """Return 0 for entities people control, 1 for the other entities and 2 for listeners that aren't entities (websocket, MQTT)."""
+    platform = getattr(getattr(update_callback, "__self__", None), "platform", None)
+    if platform is None:
+        return 2
+    return 0 if platform.domain in FAN_OUT_PRIORITY_DOMAINS else 1
+
+
+class ChunkedFanOut:
+    """Calls the listeners FAN_OUT_CHUNK_SIZE at a time, the first chunk right away and every following one in its own loop iteration.
+
+    DataUpdateCoordinator calls every listener in one go, with hundreds of entities writing state that is one long stall of the event
+    loop. Entities with controls go first so switches and lights reflect a command as early as possible.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # Time spent calling listeners, and the longest chunk, during the latest completed fan-out
+        self.total_seconds = 0.0
+        self.max_chunk_seconds = 0.0
+        self._pending: list[int] = []
+        self._done: CALLBACK_TYPE | None = None
+        self._total = 0.0
+        self._max_chunk = 0.0
+        self._cancel: Callable[[], None] | None = None
+
+    @callback
+    def start(self, listeners: Listeners, done: CALLBACK_TYPE) -> None:
+        """Start calling the listeners, then `done` once all of them had their turn."""
+        # A fan-out still in progress only has stale data to hand out, the new one covers everyone. Its refresh still gets its done
+        # callback though, the coordinator does per refresh bookkeeping there.
+        previous_done = self._done
+        self.cancel()
+        if previous_done is not None:
+            self._finish(previous_done)
+        self._done = done
+        self._pending = sorted(listeners, key=lambda listener_id: listener_priority(listeners[listener_id][0]))
+        self._pending.reverse()
+        self._total = self._max_chunk = 0.0
+        self._run_chunk(listeners, done)
+
+    @callback
+    def cancel(self) -> None:
+        if self._cancel is not None:
+            self._cancel()
+            self._cancel = None
+        self._pending = []
+        self._done = None
+
+    @callback
+    def _run_chunk(self, listeners: Listeners, done: CALLBACK_TYPE) -> None:
+        self._cancel = None
+        start = time.monotonic()
+        pending = self._pending
+        for _ in range(FAN_OUT_CHUNK_SIZE):
+            # A listener may have started a new fan-out, which takes over from here
+            if not pending or pending is not self._pending:
+                break
+            # Listeners removed since the fan-out started (an entity removed or a websocket closed) are skipped
+            if (listener := listeners.get(pending.pop())) is not None:
+                listener[0]()
+        if pending is not self._pending:
+            return
+        elapsed = time.monotonic() - start
+        self._total += elapsed
+        self._max_chunk = max(self._max_chunk, elapsed)
+        if self._pending:
+            self._cancel = self.hass.loop.call_soon(self._run_chunk, listeners, done).cancel
+            return
+        self._done = None
+        self._finish(done)
+
+    @callback
+    def _finish(self, done: CALLBACK_TYPE) -> None:
+        self.total_seconds, self.max_chunk_seconds = self._total, self._max_chunk
+        done()
@@ -11,20 +11,21 @@ from homeassistant.util.color import brightness_to_value, value_to_brightness
 from pyomnilogic_local import ColorLogicLight, OmniEquipmentNotInitializedError
 from pyomnilogic_local.omnitypes import ColorLogicBrightness, ColorLogicLightType, ColorLogicPowerState
 
-from .coordinator import OmniLogicCoordinator
+from .const import BRIGHTNESS_SCALE, DOMAIN, KEY_COORDINATOR
+from .entity import OmniLogicEntity, config_cached, cycle_cached
+from .entity_profile import apply_entity_profile
+from .light_tracker import PendingLightRequest
+from .tracing import traced_command
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, KEY_COORDINATOR
-from .entity import OmniLogicEntity
+    from .coordinator import OmniLogicCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-BRIGHTNESS_SCALE = (0, 4)
-
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up the light platform."""
@@ -35,15 +36,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for _, _, light in all_lights.items():
         entities.append(OmniLogicLightEntity(coordinator=coordinator, equipment=light))
 
-    async_add_entities(entities)
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
     """Light entity for ColorLogic lights."""
 
     _attr_supported_features = LightEntityFeature.EFFECT
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset({"omni_pending_request"})
+
+    def __init__(self, coordinator: OmniLogicCoordinator, equipment: ColorLogicLight) -> None:
+        super().__init__(coordinator, equipment)
+        self.tracker = coordinator.light_tracker(equipment.system_id)
 
     @property
+    @config_cached
     def supported_color_modes(self) -> set[ColorMode]:
         match self.equipment.equip_type:
             case ColorLogicLightType.SAM | ColorLogicLightType.TWO_FIVE | ColorLogicLightType.UCL:
@@ -52,6 +59,7 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
                 return {ColorMode.ONOFF}
 
     @property
+    @config_cached
     def color_mode(self) -> ColorMode | None:
         match self.equipment.equip_type:
             case ColorLogicLightType.SAM | ColorLogicLightType.TWO_FIVE | ColorLogicLightType.UCL:
@@ -60,6 +68,7 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
                 return ColorMode.ONOFF
 
     @property
+    @cycle_cached
     def is_on(self) -> bool | None:
         return self.equipment.state not in [
             ColorLogicPowerState.OFF,
@@ -68,10 +77,12 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
         ]
 
     @property
+    @cycle_cached
     def brightness(self) -> int:
         return value_to_brightness(BRIGHTNESS_SCALE, self.equipment.brightness.value)
 
     @property
+    @cycle_cached
     def effect(self) -> str | None:
         try:
             return str(self.equipment.show)
@@ -79,6 +90,7 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
             return None
 
     @property
+    @config_cached
     def effect_list(self) -> list[str] | None:
         if self.equipment.effects is None:
             return None
@@ -90,17 +102,33 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
             "omni_state": str(self.equipment.state),
             "omni_speed": str(self.equipment.speed),
             "omni_brightness": self.equipment.brightness,
+            "omni_pending_request": self.tracker.pending is not None,
         }
 
+    def _queue_until_ready(self, request: PendingLightRequest) -> bool:
+        """Queue the request if the light is only busy transitioning, returns True if it was queued.
+
+        The controller rejects commands while a light is changing state, rather than making the user retry we hold on to the most
+        recent request and send it as soon as the light is ready. If the backyard is in service mode we still raise.
+        """
+        if self.equipment.is_ready:
+            return False
+        if self.coordinator.omni.backyard.is_service_mode:
+            msg = f"The OmniLogic backyard is in state {self.coordinator.omni.backyard.state} and cannot accept commands, try again later."
+            raise HomeAssistantError(msg)
+        self.tracker.queue(request)
+        self.coordinator.do_next_refresh_after()
+        self.async_write_ha_state()
+        return True
+
     # The "Any" below here isn't great, we should create a type for this later
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on.
 
         Example method how to request data updates.
         """
         _LOGGER.debug("turning on light ID: %s, %s", self.system_id, kwargs)
-        if not self.equipment.is_ready:
-            raise HomeAssistantError("Light is in state %s and cannot be turned on yet, try again later." % str(self.equipment.state))
 
         # Map requested effect to omni show
         requested_effect = kwargs.get(ATTR_EFFECT, None)
@@ -124,6 +152,9 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
             ColorLogicBrightness(request_brightness),
         )
 
+        if self._queue_until_ready(PendingLightRequest(show=request_show, brightness=ColorLogicBrightness(request_brightness))):
+            return
+
         _LOGGER.debug("Setting light show to %s, speed %s, brightness %s", str(request_show), self.equipment.speed, request_brightness)
 
         try:
@@ -136,15 +167,18 @@ class OmniLogicLightEntity(OmniLogicEntity[ColorLogicLight], LightEntity):
             )
         except OmniEquipmentNotInitializedError as exc:
             raise HomeAssistantError("Light is not yet initialized, try again later.") from exc
+        self.tracker.pending = None
         self.coordinator.do_next_refresh_after()
 
     # The "Any" below here isn't great, we should create a type for this later
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off.
 
         Example method how to request data updates.
         """
-        if not self.equipment.is_ready:
-            raise HomeAssistantError("Light is in state %s and cannot be turned off yet, try again later." % str(self.equipment.state))
+        if self._queue_until_ready(PendingLightRequest(turn_off=True)):
+            return
         await self.equipment.turn_off()
+        self.tracker.pending = None
         self.coordinator.do_next_refresh_after()
@@ -0,0 +1,97 @@
+"""Track ColorLogic lights through their power state transitions."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from pyomnilogic_local.omnitypes import ColorLogicPowerState
+
+from .const import LIGHT_PENDING_REQUEST_TIMEOUT, LIGHT_TRANSITION_MAX_SCAN_INTERVAL, MIN_SCAN_INTERVAL
+
+if TYPE_CHECKING:
+    from pyomnilogic_local import ColorLogicLight
+    from pyomnilogic_local.omnitypes import ColorLogicBrightness, ColorLogicSpeed, LightShows
+
+_LOGGER = logging.getLogger(__name__)
+
+# Roughly how long a light stays in each transitional state before it moves on, in seconds.
+# These are observed values, the controller does not report them, so we keep polling quickly once they have elapsed.
+TRANSITION_DURATIONS: dict[ColorLogicPowerState, float] = {
+    ColorLogicPowerState.POWERING_OFF: 5.0,
+    ColorLogicPowerState.INITIALIZING: 15.0,
+    ColorLogicPowerState.CHANGING_SHOW: 5.0,
+    ColorLogicPowerState.FIFTEEN_SECONDS_WHITE: 15.0,
+    ColorLogicPowerState.COOLDOWN: 30.0,
+}
+
+
+@dataclass
+class PendingLightRequest:
+    """The most recent command requested while the light was not ready, unset values keep the light's current setting."""
+
+    turn_off: bool = False
+    show: LightShows | None = None
+    speed: ColorLogicSpeed | None = None
+    brightness: ColorLogicBrightness | None = None
+    requested_at: float = 0.0
+
+
+class ColorLogicLightTracker:
+    """Follow a single ColorLogic light through its power state machine.
+
+    While the light is transitioning the tracker asks the coordinator to poll quickly, and it holds on to the last command that was
+    requested in the meantime so that it can be sent as soon as the light reports that it is ready again.
+    """
+
+    def __init__(self, system_id: int) -> None:
+        self.system_id = system_id
+        self.state: ColorLogicPowerState | None = None
+        self.state_since = time.monotonic()
+        self.pending: PendingLightRequest | None = None
+
+    @property
+    def transitioning(self) -> bool:
+        return self.state in TRANSITION_DURATIONS
+
+    def observe(self, light: ColorLogicLight) -> None:
+        """Record the state reported in the latest telemetry."""
+        if light.state != self.state:
+            _LOGGER.debug("Light %s moved from %s to %s", self.system_id, self.state, light.state)
+            self.state = light.state
+            self.state_since = time.monotonic()
+
+        if self.pending is not None and time.monotonic() - self.pending.requested_at > LIGHT_PENDING_REQUEST_TIMEOUT.total_seconds():
+            _LOGGER.warning("Light %s did not become ready in time, dropping the pending request", self.system_id)
+            self.pending = None
+
+    def poll_interval(self) -> timedelta | None:
+        """Return how soon the coordinator should poll again, or None if the light is settled."""
+        if not self.transitioning:
+            return None
+        remaining = TRANSITION_DURATIONS[self.state] - (time.monotonic() - self.state_since)  # type: ignore[index]
+        return max(MIN_SCAN_INTERVAL, min(timedelta(seconds=remaining), LIGHT_TRANSITION_MAX_SCAN_INTERVAL))
+
+    def queue(self, request: PendingLightRequest) -> None:
+        """Store a request to be sent once the light is ready, replacing anything queued before."""
+        request.requested_at = time.monotonic()
+        _LOGGER.debug("Light %s is %s, queueing request %s", self.system_id, self.state, request)
+        self.pending = request
+
+    def pop_ready_request(self, light: ColorLogicLight) -> PendingLightRequest | None:
+        """Return (and forget) the pending request if the light can now accept it."""
+        if self.pending is None or not light.is_ready:
+            return None
+        request, self.pending = self.pending, None
+        return request
+
+
+async def async_send_light_request(light: ColorLogicLight, request: PendingLightRequest) -> None:
+    """Send a previously queued request to a light that is now ready."""
+    if request.turn_off:
+        await light.turn_off()
+        return
+    await light.set_show(show=request.show, speed=request.speed, brightness=request.brightness)
@@ -0,0 +1,143 @@
+"""Prometheus metrics for the health of the integration and its connection to the controller."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.const import CONTENT_TYPE_TEXT_PLAIN
+
+from .const import DOMAIN, KEY_COORDINATOR, METRICS_CHUNK_BUCKETS, METRICS_LATENCY_BUCKETS
+from .transport import InstrumentedOmniLogicAPI
+
+if TYPE_CHECKING:
+    from .coordinator import OmniLogicCoordinator
+
+
+class Histogram:
+    """Cumulative latency histogram in the Prometheus style, observing a value is a single bisect."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = METRICS_LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        # One count per bucket plus the +Inf bucket, these are made cumulative when rendered
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def render(self, name: str, labels: str, lines: list[str]) -> None:
+        cumulative = 0
+        for bound, count in zip((*map(str, self.buckets), "+Inf"), self.counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+
+
+class IntegrationMetrics:
+    """Counters and histograms updated as the coordinator refreshes and entities send commands.
+
+    Everything is recorded as it happens so rendering the metrics only formats numbers that are already in memory, a scrape never
+    talks to the controller.
+    """
+
+    def __init__(self) -> None:
+        self.refresh_latency = Histogram()
+        self.poll_delay = Histogram()
+        # The longest chunk of each fan-out, see ChunkedFanOut
+        self.fan_out_chunk = Histogram(METRICS_CHUNK_BUCKETS)
+        # Keyed by (equipment type, outcome)
+        self.command_counts: dict[tuple[str, str], int] = {}
+        self.command_latency: dict[str, Histogram] = {}
+
+    def observe_command(self, equipment_type: str, duration: float, success: bool) -> None:
+        key = (equipment_type, "success" if success else "error")
+        self.command_counts[key] = self.command_counts.get(key, 0) + 1
+        if (histogram := self.command_latency.get(equipment_type)) is None:
+            histogram = self.command_latency[equipment_type] = Histogram()
+        histogram.observe(duration)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(entry_id: str, coordinator: OmniLogicCoordinator) -> str:
+    """Render the metrics of a config entry in the Prometheus text exposition format."""
+    metrics = coordinator.metrics
+    entry = f'entry_id="{_escape(entry_id)}"'
+    lines: list[str] = []
+
+    lines.append("# HELP omnilogic_local_refresh_duration_seconds Time taken to fetch and parse the telemetry and any changed MSP config")
+    lines.append("# TYPE omnilogic_local_refresh_duration_seconds histogram")
+    metrics.refresh_latency.render("omnilogic_local_refresh_duration_seconds", entry, lines)
+
+    lines.append("# HELP omnilogic_local_poll_delay_seconds How late scheduled polls started compared to when they were planned")
+    lines.append("# TYPE omnilogic_local_poll_delay_seconds histogram")
+    metrics.poll_delay.render("omnilogic_local_poll_delay_seconds", entry, lines)
+
+    lines.append("# HELP omnilogic_local_refresh_failures_total Failed refreshes by error class")
+    lines.append("# TYPE omnilogic_local_refresh_failures_total counter")
+    for error, count in coordinator.failure_counts.items():
+        lines.append(f'omnilogic_local_refresh_failures_total{{{entry},error="{_escape(error)}"}} {count}')
+
+    lines.append("# HELP omnilogic_local_commands_total Commands sent from entities by equipment type and outcome")
+    lines.append("# TYPE omnilogic_local_commands_total counter")
+    for (equipment_type, outcome), count in metrics.command_counts.items():
+        lines.append(f'omnilogic_local_commands_total{{{entry},equipment_type="{_escape(equipment_type)}",outcome="{outcome}"}} {count}')
+
+    lines.append("# HELP omnilogic_local_command_duration_seconds Time from the entity call until the controller acknowledged the command")
+    lines.append("# TYPE omnilogic_local_command_duration_seconds histogram")
+    for equipment_type, histogram in metrics.command_latency.items():
+        histogram.render("omnilogic_local_command_duration_seconds", f'{entry},equipment_type="{_escape(equipment_type)}"', lines)
+
+    lines.append("# HELP omnilogic_local_fan_out_max_chunk_seconds Longest chunk of listener updates in each refresh")
+    lines.append("# TYPE omnilogic_local_fan_out_max_chunk_seconds histogram")
+    metrics.fan_out_chunk.render("omnilogic_local_fan_out_max_chunk_seconds", entry, lines)
+
+    lines.append("# HELP omnilogic_local_suppressed_writes_total State writes skipped because the change was not significant")
+    lines.append("# TYPE omnilogic_local_suppressed_writes_total counter")
+    lines.append(f"omnilogic_local_suppressed_writes_total{{{entry}}} {coordinator.suppressed_writes}")
+
+    lines.append("# HELP omnilogic_local_poll_interval_seconds Current interval until the next poll of the controller")
+    lines.append("# TYPE omnilogic_local_poll_interval_seconds gauge")
+    interval = coordinator.update_interval.total_seconds() if coordinator.update_interval is not None else 0
+    lines.append(f"omnilogic_local_poll_interval_seconds{{{entry}}} {interval}")
+
+    lines.append("# HELP omnilogic_local_poll_phase_seconds Offset of this entry's regular polls within the idle poll interval")
+    lines.append("# TYPE omnilogic_local_poll_phase_seconds gauge")
+    lines.append(f"omnilogic_local_poll_phase_seconds{{{entry}}} {coordinator.scheduler.phase(entry_id)}")
+
+    if isinstance(api := coordinator.omni._api, InstrumentedOmniLogicAPI):
+        lines.append("# HELP omnilogic_local_request_limiter_wait_seconds_total Time requests waited for the limit shared by all entries")
+        lines.append("# TYPE omnilogic_local_request_limiter_wait_seconds_total counter")
+        lines.append(f"omnilogic_local_request_limiter_wait_seconds_total{{{entry}}} {api.limiter_wait}")
+
+    lines.append("# HELP omnilogic_local_last_update_success Whether the last refresh succeeded")
+    lines.append("# TYPE omnilogic_local_last_update_success gauge")
+    lines.append(f"omnilogic_local_last_update_success{{{entry}}} {int(coordinator.last_update_success)}")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+class OmniLogicMetricsView(HomeAssistantView):
+    """Serve the metrics of a config entry, authenticated like the rest of the Home Assistant API."""
+
+    url = "/api/omnilogic_local/{entry_id}/metrics"
+    name = "api:omnilogic_local:metrics"
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        hass = request.app[KEY_HASS]
+        if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+            return self.json_message("Unknown config entry", HTTPStatus.NOT_FOUND)
+        return web.Response(text=render_metrics(entry_id, entry_data[KEY_COORDINATOR]), content_type=CONTENT_TYPE_TEXT_PLAIN)
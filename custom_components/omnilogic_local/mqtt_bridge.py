@@ -0,0 +1,91 @@
+"""Publish the telemetry of a config entry to MQTT, through the broker configured in Home Assistant's MQTT integration.
+
+Topics, below the configured prefix:
+
+- `<prefix>/available`: `online` or `offline` (retained)
+- `<prefix>/snapshot`: every piece of equipment keyed by system ID (retained), published on startup and whenever the MSP config changes
+- `<prefix>/equipment/<system_id>`: only the fields that changed in the latest refresh, an empty payload when the equipment was removed
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.components import mqtt
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+    from pyomnilogic_local.models.mspconfig import MSPConfig
+
+    from .coordinator import OmniLogicCoordinator
+    from .snapshot import SnapshotDiff
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MqttBridge:
+    """Publishes the coordinator's telemetry changes after every refresh."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: OmniLogicCoordinator, prefix: str) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.prefix = prefix.rstrip("/")
+        self._generation = 0
+        self._mspconfig: MSPConfig | None = None
+        self._available: bool | None = None
+        self._remove_listener: Callable[[], None] | None = None
+
+    async def async_start(self) -> None:
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.warning("The MQTT integration is not set up, not publishing OmniLogic telemetry to %s", self.prefix)
+            return
+        await self._async_publish_snapshot()
+        self._remove_listener = self.coordinator.async_add_listener(self._handle_coordinator_update)
+        _LOGGER.info("Publishing OmniLogic telemetry to MQTT below %s", self.prefix)
+
+    async def async_stop(self) -> None:
+        if self._remove_listener is None:
+            return
+        self._remove_listener()
+        self._remove_listener = None
+        await self._async_publish_available(False)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        config_entry = self.coordinator.config_entry
+        if self.coordinator.omni.mspconfig is not self._mspconfig:
+            # Equipment may have been added, removed or renamed, give consumers a complete picture again
+            config_entry.async_create_background_task(self.hass, self._async_publish_snapshot(), "omnilogic_local mqtt snapshot")
+            return
+        self._generation, diff = self.coordinator.snapshots.changes_since(self._generation)
+        if diff or self._available != self.coordinator.last_update_success:
+            config_entry.async_create_background_task(self.hass, self._async_publish_changes(diff), "omnilogic_local mqtt changes")
+
+    async def _async_publish_snapshot(self) -> None:
+        self._mspconfig = self.coordinator.omni.mspconfig
+        self._generation, snapshot = self.coordinator.snapshots.snapshot()
+        await self._async_publish(f"{self.prefix}/snapshot", json_dumps(snapshot), retain=True)
+        await self._async_publish_available(self.coordinator.last_update_success)
+
+    async def _async_publish_changes(self, diff: SnapshotDiff) -> None:
+        for system_id, fields in diff.items():
+            await self._async_publish(f"{self.prefix}/equipment/{system_id}", "" if fields is None else json_dumps(fields))
+        if self._available != self.coordinator.last_update_success:
+            await self._async_publish_available(self.coordinator.last_update_success)
+
+    async def _async_publish_available(self, available: bool) -> None:
+        self._available = available
+        await self._async_publish(f"{self.prefix}/available", "online" if available else "offline", retain=True)
+
+    async def _async_publish(self, topic: str, payload: str, retain: bool = False) -> None:
+        try:
+            await mqtt.async_publish(self.hass, topic, payload, retain=retain)
+        except HomeAssistantError as err:
+            # MQTT was disabled or removed while we were running, there is nothing useful to retry
+            _LOGGER.debug("Unable to publish to %s: %s", topic, err)
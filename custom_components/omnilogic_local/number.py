@@ -15,8 +15,10 @@ from pyomnilogic_local.omnitypes import (
     PumpType,
 )
 
-from .const import DOMAIN, KEY_COORDINATOR
-from .entity import OmniLogicEntity
+from .const import DOMAIN, ENTITY_PROFILE_STANDARD, KEY_COORDINATOR
+from .entity import OmniLogicEntity, config_cached
+from .entity_profile import apply_entity_profile
+from .tracing import traced_command
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -70,7 +72,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     "Your system has an unsupported chlorinator, please raise an issue: https://github.com/cryptk/haomnilogic-local/issues"
                 )
 
-    async_add_entities(entities)
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 type PumpTypes = Pump | Filter
@@ -79,7 +81,12 @@ type PumpTypes = Pump | Filter
 class OmniLogicVSPNumberEntity[PT: PumpTypes](OmniLogicEntity[PT], NumberEntity):
     """Number entity for variable speed pump or filter speed control."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     _attr_icon: str = "mdi:gauge"
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset(
+        {"omni_max_rpm", "omni_min_rpm", "omni_max_percent", "omni_min_percent", "omni_current_rpm", "omni_current_percent"}
+    )
 
     @property
     def name(self) -> Any:
@@ -126,16 +133,23 @@ class OmniLogicVSPNumberEntity[PT: PumpTypes](OmniLogicEntity[PT], NumberEntity)
         return self.current_pct
 
     @property
-    def _extra_state_attributes(self) -> dict[str, Any]:
-        return {
+    @config_cached
+    def _static_state_attributes(self) -> dict[str, Any]:
+        return super()._static_state_attributes | {
             "omni_max_rpm": self.max_rpm,
             "omni_min_rpm": self.min_rpm,
             "omni_max_percent": self.max_pct,
             "omni_min_percent": self.min_pct,
+        }
+
+    @property
+    def _extra_state_attributes(self) -> dict[str, Any]:
+        return {
             "omni_current_rpm": self.current_rpm,
             "omni_current_percent": self.current_pct,
         }
 
+    @traced_command
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         await self.equipment.set_speed(int(value))
@@ -153,6 +167,8 @@ class OmniLogicFilterNumberEntity(OmniLogicVSPNumberEntity[Filter]):
 class OmniLogicSolarSetPointNumberEntity(OmniLogicEntity[Heater], NumberEntity):
     """Number entity for solar heater set point control."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     _attr_device_class = NumberDeviceClass.TEMPERATURE
     _attr_name = "Solar Set Point"
     _attr_mode = NumberMode.BOX
@@ -175,6 +191,7 @@ class OmniLogicSolarSetPointNumberEntity(OmniLogicEntity[Heater], NumberEntity):
         # Home Assistant will handle unit conversion based on user preferences
         return str(UnitOfTemperature.FAHRENHEIT)
 
+    @traced_command
     async def async_set_native_value(self, value: float) -> None:
         await self.equipment.set_solar_temperature(int(value))
         self.coordinator.do_next_refresh_after()
@@ -183,6 +200,8 @@ class OmniLogicSolarSetPointNumberEntity(OmniLogicEntity[Heater], NumberEntity):
 class OmniLogicChlorinatorTimedPercentNumberEntity(OmniLogicEntity[Chlorinator], NumberEntity):
     """Number entity for chlorinator timed percent control."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     _attr_name = "Chlorinator Timed Percent"
     _attr_native_max_value = 100
     _attr_native_min_value = 0
@@ -194,6 +213,7 @@ class OmniLogicChlorinatorTimedPercentNumberEntity(OmniLogicEntity[Chlorinator],
     def native_value(self) -> float | None:
         return self.equipment.timed_percent_telemetry
 
+    @traced_command
     async def async_set_native_value(self, value: float) -> None:
         await self.equipment.set_timed_percent(int(value))
         self.coordinator.do_next_refresh_after()
@@ -0,0 +1,52 @@
+"""Poll planning based on the schedules configured in the OmniLogic MSP config."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from .const import IDLE_SCAN_INTERVAL, MIN_SCAN_INTERVAL, SCHEDULE_POLL_OFFSETS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyomnilogic_local import Schedule
+
+
+def schedule_transitions(schedules: Iterable[Schedule], now: datetime) -> list[datetime]:
+    """Return the upcoming start and end times of all enabled schedules, sorted.
+
+    Schedules are stored by the controller in its local time, we assume that matches the Home Assistant time zone, which `now`
+    must be in. We look from yesterday (for schedules running past midnight) through tomorrow, which is plenty given that we re-plan on
+    every refresh.
+    """
+    transitions: set[datetime] = set()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    for schedule in schedules:
+        if not schedule.enabled:
+            continue
+        for day_offset in (-1, 0, 1):
+            day = today + timedelta(days=day_offset)
+            # days_active_raw is a bitmask where bit 0 is Monday, the same as datetime.weekday()
+            if not schedule.days_active_raw & (1 << day.weekday()):
+                continue
+            start = day.replace(hour=schedule.start_hour, minute=schedule.start_minute)
+            end = day.replace(hour=schedule.end_hour, minute=schedule.end_minute)
+            # Schedules that run past midnight end on the following day
+            if end <= start:
+                end += timedelta(days=1)
+            transitions.update(transition for transition in (start, end) if transition + SCHEDULE_POLL_OFFSETS[-1] > now)
+    return sorted(transitions)
+
+
+def next_poll_interval(transitions: Iterable[datetime], now: datetime) -> timedelta:
+    """Return how long to wait before the next poll.
+
+    Polls are placed shortly after each scheduled transition so that schedule driven changes show up quickly, otherwise we fall back
+    to the slower idle interval.
+    """
+    for transition in transitions:
+        for offset in SCHEDULE_POLL_OFFSETS:
+            if (poll_at := transition + offset) > now:
+                return max(MIN_SCAN_INTERVAL, min(poll_at - now, IDLE_SCAN_INTERVAL))
+    return IDLE_SCAN_INTERVAL
@@ -0,0 +1,94 @@
+"""Profile a number of coordinator cycles on demand."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from .const import PROFILE_TOP_ALLOCATIONS, PROFILE_TOP_FUNCTIONS
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CycleProfiler:
+    """Collect cProfile (and optionally tracemalloc) data across the next `cycles` coordinator cycles.
+
+    A cycle runs from the start of the telemetry refresh until every entity has handled the update and written its state. The profiler
+    is only enabled inside cycles, but it sees everything running on the event loop during that time, including other integrations
+    while we wait on the controller.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path, cycles: int, trace_memory: bool) -> None:
+        self.hass = hass
+        self.path = path
+        self.remaining = cycles
+        self.cycles = cycles
+        self.trace_memory = trace_memory
+        self._profile = cProfile.Profile()
+        self._active = False
+        self._started_tracemalloc = False
+
+    def start_cycle(self) -> None:
+        """Start profiling a cycle, raises ValueError when another profiler (such as Home Assistant's own) is already running."""
+        try:
+            self._profile.enable()
+        except ValueError:
+            self.abort()
+            raise
+        self._active = True
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def check_available(self) -> None:
+        """Raise ValueError if the profiler can't be enabled right now."""
+        self._profile.enable()
+        self._profile.disable()
+
+    def abort(self) -> None:
+        """Stop without writing a report."""
+        if self._active:
+            self._profile.disable()
+            self._active = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def end_cycle(self) -> bool:
+        """Stop profiling the current cycle, returns True once all of the requested cycles have been profiled."""
+        if not self._active:
+            return False
+        self._profile.disable()
+        self._active = False
+        self.remaining -= 1
+        return self.remaining <= 0
+
+    async def async_finish(self) -> None:
+        """Write the collected statistics to the report file."""
+        snapshot = tracemalloc.take_snapshot() if self.trace_memory and tracemalloc.is_tracing() else None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        await self.hass.async_add_executor_job(self._write_report, snapshot)
+        _LOGGER.info("Wrote OmniLogic profile of %s cycles to %s", self.cycles, self.path)
+
+    def _write_report(self, snapshot: tracemalloc.Snapshot | None) -> None:
+        report = io.StringIO()
+        report.write(f"OmniLogic Local profile of {self.cycles} coordinator cycles\n\n")
+        stats = pstats.Stats(self._profile, stream=report)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(PROFILE_TOP_FUNCTIONS)
+        if snapshot is not None:
+            report.write("Top allocation sites\n\n")
+            for stat in snapshot.statistics("lineno")[:PROFILE_TOP_ALLOCATIONS]:
+                report.write(f"{stat}\n")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(report.getvalue(), encoding="utf-8")
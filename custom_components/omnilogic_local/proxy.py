@@ -0,0 +1,180 @@
+"""Share a single controller connection between several instances of the integration.
+
+The config entry that owns the controller can serve a proxy on a local TCP port. Other instances of the integration (or anything else
+that speaks the protocol below) connect to the proxy instead of the controller, so the controller only ever sees one client polling it.
+
+The protocol is newline delimited JSON, one request and one reply per line:
+
+- request: `{"secret": "<shared secret>", "message_type": "GET_TELEMETRY", "message": "<XML request>", "response": true}`
+- reply: `{"response": "<XML response>"}` or `{"error": "<description>"}`
+
+Requests without the owner's shared secret, and message types the integration itself never sends, are rejected. Telemetry and MSP config
+requests are answered from the owner's latest poll without talking to the controller, every other message is forwarded to the
+controller, and commands schedule a refresh on the owner so every consumer sees the change on its next poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from pyomnilogic_local.omnitypes import MessageType
+
+from .const import PROXY_MAX_LINE
+from .transport import InstrumentedOmniLogicAPI
+
+if TYPE_CHECKING:
+    from .coordinator import OmniLogicCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# The messages the integration sends, anything else (creating or deleting schedules, changing CSAD targets) can't go through the proxy
+PROXY_ALLOWED_MESSAGES = frozenset(
+    {
+        MessageType.GET_TELEMETRY,
+        MessageType.REQUEST_CONFIGURATION,
+        MessageType.GET_ALARM_LIST,
+        MessageType.GET_FILTER_DIAGNOSTIC_INFO,
+        MessageType.SET_EQUIPMENT,
+        MessageType.SET_FILTER_SPEED,
+        MessageType.SET_HEATER_COMMAND,
+        MessageType.SET_HEATER_ENABLED,
+        MessageType.SET_HEATER_MODE_COMMAND,
+        MessageType.SET_SOLAR_SET_POINT_COMMAND,
+        MessageType.SET_CHLOR_ENABLED,
+        MessageType.SET_CHLOR_PARAMS,
+        MessageType.SET_SUPERCHLORINATE,
+        MessageType.SET_STANDALONE_LIGHT_SHOW,
+        MessageType.SET_SPILLOVER,
+        MessageType.RUN_GROUP_CMD,
+        MessageType.RESTORE_IDLE_STATE,
+        MessageType.EDIT_SCHEDULE,
+    }
+)
+
+
+class OmniLogicProxyServer:
+    """Serve the controller owned by a coordinator to proxy clients."""
+
+    def __init__(self, coordinator: OmniLogicCoordinator, host: str, port: int, secret: str) -> None:
+        self.coordinator = coordinator
+        self.host = host
+        self.port = port
+        self._secret = secret.encode()
+        self.clients = 0
+        self._server: asyncio.Server | None = None
+
+    async def async_start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, host=self.host, port=self.port, limit=PROXY_MAX_LINE)
+        _LOGGER.info("Serving the OmniLogic controller to proxy clients on %s port %s", self.host, self.port)
+
+    async def async_stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        _LOGGER.debug("Proxy client %s connected", peer)
+        self.clients += 1
+        try:
+            while line := await reader.readline():
+                writer.write(json.dumps(await self._async_handle_request(line)).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError) as err:
+            # ValueError is raised by readline when a client sends a line longer than the limit
+            _LOGGER.debug("Proxy client %s disconnected: %s", peer, err)
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def _async_handle_request(self, line: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+            secret: str = request.get("secret", "")
+            message_type = MessageType[request["message_type"]]
+            message: str = request["message"]
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            return {"error": f"Invalid request: {err!r}"}
+        if not isinstance(secret, str) or not hmac.compare_digest(secret.encode(), self._secret):
+            _LOGGER.debug("Rejected a proxy request with the wrong secret")
+            return {"error": "Not authorized"}
+        if message_type not in PROXY_ALLOWED_MESSAGES:
+            return {"error": f"{message_type.name} is not allowed through the proxy"}
+
+        omni = self.coordinator.omni
+        if message_type in (MessageType.GET_TELEMETRY, MessageType.REQUEST_CONFIGURATION):
+            if not self.coordinator.last_update_success:
+                # Don't hand out stale data as if it were current, let the clients mark their entities unavailable like the owner does
+                return {"error": "The controller is not responding"}
+            return {"response": omni.telemetry._raw if message_type == MessageType.GET_TELEMETRY else omni.mspconfig._raw}
+        try:
+            if request.get("response", False):
+                return {"response": await omni._api.async_send_and_receive(message_type, message)}
+            await omni._api.async_send(message_type, message)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Proxy request %s failed: %s", message_type.name, err)
+            return {"error": f"{type(err).__name__}: {err}"}
+        self.coordinator.do_next_refresh_after()
+        return {}
+
+
+class ProxyOmniLogicAPI(InstrumentedOmniLogicAPI):
+    """OmniLogicAPI that sends every message through an OmniLogic Local proxy instead of directly to the controller."""
+
+    def __init__(self, controller_ip: str, controller_port: int, response_timeout: float, secret: str) -> None:
+        super().__init__(controller_ip, controller_port, response_timeout)
+        self._secret = secret
+        self._lock = asyncio.Lock()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def _async_send(self, message_type: MessageType, message: str) -> None:
+        await self._async_request(message_type, message, response=False)
+
+    async def _async_send_and_receive(self, message_type: MessageType, message: str) -> str:
+        return await self._async_request(message_type, message, response=True)
+
+    async def _async_request(self, message_type: MessageType, message: str, response: bool) -> str:
+        payload = {"secret": self._secret, "message_type": message_type.name, "message": message, "response": response}
+        request = json.dumps(payload).encode() + b"\n"
+        # One request at a time per connection, replies don't carry an ID so they must come back in order
+        async with self._lock:
+            try:
+                async with asyncio.timeout(self.response_timeout):
+                    reader, writer = await self._async_connect()
+                    writer.write(request)
+                    await writer.drain()
+                    line = await reader.readline()
+            except OSError:
+                await self.async_close()
+                raise
+            if not line:
+                await self.async_close()
+                msg = f"OmniLogic proxy at {self.controller_ip}:{self.controller_port} closed the connection"
+                raise ConnectionError(msg)
+        reply = json.loads(line)
+        if (error := reply.get("error")) is not None:
+            msg = f"OmniLogic proxy error: {error}"
+            raise ConnectionError(msg)
+        return reply.get("response", "")
+
+    async def _async_connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._reader is None or self._writer is None or self._writer.is_closing():
+            self._reader, self._writer = await asyncio.open_connection(self.controller_ip, self.controller_port, limit=PROXY_MAX_LINE)
+        return self._reader, self._writer
+
+    async def async_close(self) -> None:
+        if (writer := self._writer) is None:
+            return
+        self._reader = self._writer = None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
@@ -0,0 +1,49 @@
+"""Deadband and rate limiting rules used to decide when a sensor reading is worth writing to Home Assistant."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .const import CONF_DEADBAND, CONF_MIN_INTERVAL, DEFAULT_PUBLISH_POLICIES, PUBLISH_MAX_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class PublishPolicy:
+    """Only publish a new value once it has moved by at least `deadband` and `min_interval` seconds have passed.
+
+    A value that differs from the published one by less than the deadband is still published after PUBLISH_MAX_INTERVAL seconds, or
+    `min_interval` when that is longer.
+    """
+
+    deadband: float
+    min_interval: float
+
+    def is_significant(self, old: Any, new: Any, elapsed: float) -> bool:
+        """Return whether the change from the last published value should be written."""
+        if old == new:
+            return False
+        # Changes to or from "unknown" and to or from zero (equipment turning on or off) are always significant
+        if old is None or new is None or old == 0 or new == 0:
+            return True
+        if not isinstance(old, int | float) or not isinstance(new, int | float):
+            return True
+        if elapsed < self.min_interval:
+            return False
+        # Never write a small change sooner than a large one would be written
+        return abs(new - old) >= self.deadband or elapsed >= max(PUBLISH_MAX_INTERVAL, self.min_interval)
+
+
+def publish_policies_from_options(options: Mapping[str, Any]) -> dict[str, PublishPolicy]:
+    """Build the publish policy for each sensor kind, falling back to the defaults for anything not configured."""
+    policies: dict[str, PublishPolicy] = {}
+    for kind, (deadband, min_interval) in DEFAULT_PUBLISH_POLICIES.items():
+        configured = options.get(kind, {})
+        policies[kind] = PublishPolicy(
+            deadband=float(configured.get(CONF_DEADBAND, deadband)),
+            min_interval=float(configured.get(CONF_MIN_INTERVAL, min_interval)),
+        )
+    return policies
@@ -0,0 +1,172 @@
+"""Record the raw traffic with an OmniLogic controller, and replay those recordings through the integration.
+
+Recordings are gzip compressed newline delimited JSON. The first line is a header holding the MSP config and telemetry at the time the
+recording started, every following line is an event with `t` (seconds since the recording started):
+
+- `response`: the raw response to a request (telemetry, MSP config, ...)
+- `command`: a command that was sent to the controller
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+from pyomnilogic_local.omnitypes import MessageType
+
+from .const import DOMAIN, RECORDING_FLUSH_LINES
+from .transport import InstrumentedOmniLogicAPI
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import OmniLogicCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDING_VERSION = 1
+
+
+def _decode(message: str | bytes) -> str:
+    return message.decode("utf-8") if isinstance(message, bytes) else message
+
+
+class TelemetryRecorder:
+    """API listener that writes every message exchanged with the controller to a recording file."""
+
+    def __init__(self, hass: HomeAssistant, path: Path, msp_config: str, telemetry: str) -> None:
+        self.hass = hass
+        self.path = path
+        self._start = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._lines: list[str] = []
+        self._append(
+            {
+                "event": "header",
+                "version": RECORDING_VERSION,
+                "started": dt_util.utcnow().isoformat(),
+                "msp_config": msp_config,
+                "telemetry": telemetry,
+            }
+        )
+
+    def on_send(self, message_type: MessageType, message: str | bytes, elapsed: float) -> None:
+        self._append({"event": "command", "message_type": message_type.name, "message": _decode(message)})
+
+    def on_exchange(self, message_type: MessageType, message: str | bytes, response: str, elapsed: float) -> None:
+        self._append({"event": "response", "message_type": message_type.name, "response": response})
+
+    def _append(self, event: dict[str, Any]) -> None:
+        event["t"] = round(time.monotonic() - self._start, 3)
+        self._lines.append(json.dumps(event, separators=(",", ":")))
+        if len(self._lines) >= RECORDING_FLUSH_LINES:
+            self.hass.async_create_background_task(self.async_flush(), f"{DOMAIN} recording flush")
+
+    async def async_flush(self) -> None:
+        """Append everything recorded so far to the file."""
+        lines, self._lines = self._lines, []
+        if not lines:
+            return
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Each flush appends a new gzip member, gzip readers treat concatenated members as a single stream
+        with gzip.open(self.path, "at", encoding="utf-8") as recording:
+            recording.writelines(f"{line}\n" for line in lines)
+
+
+async def async_start_recording(hass: HomeAssistant, coordinator: OmniLogicCoordinator, path: Path) -> TelemetryRecorder:
+    """Start recording the controller traffic for a config entry."""
+    api = coordinator.omni._api
+    if not isinstance(api, InstrumentedOmniLogicAPI):
+        msg = "Recording is only possible when connected to a controller"
+        raise TypeError(msg)
+    recorder = TelemetryRecorder(hass, path, coordinator.omni.mspconfig._raw, coordinator.omni.telemetry._raw)
+    api.listeners.append(recorder)
+    coordinator.recording = recorder
+    _LOGGER.info("Recording OmniLogic traffic to %s", path)
+    return recorder
+
+
+async def async_stop_recording(coordinator: OmniLogicCoordinator) -> None:
+    """Stop the active recording, if any, and write out the remaining events."""
+    if (recorder := coordinator.recording) is None:
+        return
+    coordinator.recording = None
+    api = coordinator.omni._api
+    if isinstance(api, InstrumentedOmniLogicAPI) and recorder in api.listeners:
+        api.listeners.remove(recorder)
+    await recorder.async_flush()
+    _LOGGER.info("Finished recording OmniLogic traffic to %s", recorder.path)
+
+
+@dataclass
+class Recording:
+    header: dict[str, Any]
+    # Each cycle is a telemetry response followed by any other responses received before the next telemetry response
+    cycles: list[list[dict[str, Any]]] = field(default_factory=list)
+
+
+def load_recording(path: str) -> Recording:
+    """Load a recording from disk, this does blocking I/O."""
+    with gzip.open(path, "rt", encoding="utf-8") as lines:
+        events = [json.loads(line) for line in lines if line.strip()]
+    if not events or events[0].get("event") != "header" or events[0].get("version") != RECORDING_VERSION:
+        msg = f"{path} is not an OmniLogic Local recording"
+        raise ValueError(msg)
+    recording = Recording(header=events[0])
+    for event in events[1:]:
+        if event["event"] != "response":
+            continue
+        if event["message_type"] == MessageType.GET_TELEMETRY.name or not recording.cycles:
+            recording.cycles.append([])
+        recording.cycles[-1].append(event)
+    return recording
+
+
+class ReplayOmniLogicAPI(InstrumentedOmniLogicAPI):
+    """OmniLogicAPI that answers requests from a recording instead of a controller, commands are discarded."""
+
+    def __init__(self, recording: Recording) -> None:
+        super().__init__("replay", 10444, 1.0)
+        self.recording = recording
+        self.responses: dict[MessageType, str] = {
+            MessageType.REQUEST_CONFIGURATION: recording.header["msp_config"],
+            MessageType.GET_TELEMETRY: recording.header["telemetry"],
+        }
+
+    async def _async_send(self, message_type: MessageType, message: str) -> None:
+        _LOGGER.debug("Replay: discarding %s command", message_type.name)
+
+    async def _async_send_and_receive(self, message_type: MessageType, message: str) -> str:
+        if (response := self.responses.get(message_type)) is None:
+            # Behave the same as a controller that did not answer
+            msg = f"Replay: the recording has no response for {message_type.name}"
+            raise TimeoutError(msg)
+        return response
+
+
+async def async_replay(coordinator: OmniLogicCoordinator, api: ReplayOmniLogicAPI, speed: float) -> None:
+    """Feed each recorded cycle through the coordinator (and so every entity), at `speed` times real time, 0 means no delay."""
+    recording = api.recording
+    _LOGGER.info("Replaying %s cycles recorded at %s, speed %s", len(recording.cycles), recording.header["started"], speed)
+    start = time.monotonic()
+    previous = 0.0
+    for cycle in recording.cycles:
+        if speed > 0:
+            await asyncio.sleep((cycle[0]["t"] - previous) / speed)
+        previous = cycle[0]["t"]
+        for event in cycle:
+            api.responses[MessageType[event["message_type"]]] = event["response"]
+        await coordinator.async_refresh()
+    _LOGGER.info("Replay finished, %s cycles in %.1f seconds", len(recording.cycles), time.monotonic() - start)
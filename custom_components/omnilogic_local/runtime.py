@@ -0,0 +1,128 @@
+"""Accumulate equipment runtime (today, this week and lifetime) from the on/off state reported in telemetry."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, TypedDict
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import ACCUMULATOR_SAVE_DELAY, DOMAIN, MAX_SAMPLE_GAP
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import date
+
+    from homeassistant.core import HomeAssistant
+    from pyomnilogic_local import OmniLogic
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+@dataclass(slots=True)
+class RuntimeCounter:
+    """Seconds of runtime for a single piece of equipment."""
+
+    today: float = 0.0
+    week: float = 0.0
+    lifetime: float = 0.0
+    # The local date and ISO week the today and week totals belong to
+    day: str = ""
+    iso_week: str = ""
+
+
+class RuntimeStoreData(TypedDict):
+    # Keys are system IDs as strings, JSON does not allow integer keys
+    counters: dict[str, dict[str, float | str]]
+
+
+def running_equipment(omni: OmniLogic) -> Iterator[tuple[int | None, bool]]:
+    """Yield the system ID and on/off state of every piece of equipment we track runtime for."""
+    for _, _, filt in omni.all_filters.items():
+        yield filt.system_id, filt.is_on
+    for _, _, pump in omni.all_pumps.items():
+        yield pump.system_id, pump.is_on
+    for _, _, relay in omni.all_relays.items():
+        yield relay.system_id, relay.is_on
+    for _, _, heater_equip in omni.all_heater_equipment.items():
+        yield heater_equip.system_id, heater_equip.is_on
+    for _, _, chlorinator in omni.all_chlorinators.items():
+        # A chlorinator is "on" whenever it is enabled, what we want to count is how long the cell was actually generating
+        yield chlorinator.system_id, chlorinator.is_generating
+
+
+class RuntimeTracker:
+    """Count how long each piece of equipment has been running, without needing to query the recorder history.
+
+    Time between two consecutive samples is credited to the equipment if it was running at the earlier sample. Gaps longer than
+    MAX_SAMPLE_GAP are skipped rather than guessed at.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, persist: bool = True) -> None:
+        self._store: Store[RuntimeStoreData] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.runtime")
+        self.counters: dict[int, RuntimeCounter] = {}
+        self._last_sample: dict[int, tuple[float, bool]] = {}
+        # Only one delayed save is scheduled at a time, like EnergyMeter, or polling would keep postponing it
+        self._save_pending = False
+        self._persist = persist
+
+    async def async_load(self) -> None:
+        """Restore the counters from storage."""
+        if not self._persist:
+            return
+        if (data := await self._store.async_load()) is not None:
+            self.counters = {int(system_id): RuntimeCounter(**counter) for system_id, counter in data["counters"].items()}  # type: ignore[arg-type]
+
+    def sample(self, omni: OmniLogic) -> None:
+        """Credit the time since the previous sample to every piece of equipment that was running."""
+        now = time.monotonic()
+        today = dt_util.now().date()
+        for system_id, is_on in running_equipment(omni):
+            if system_id is None:
+                continue
+            self._accumulate(system_id, is_on, now, today)
+        if self._persist and not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, ACCUMULATOR_SAVE_DELAY)
+
+    def _accumulate(self, system_id: int, is_on: bool, now: float, today: date) -> None:
+        counter = self.counters.setdefault(system_id, RuntimeCounter())
+        day = today.isoformat()
+        iso_year, iso_week, _ = today.isocalendar()
+        week = f"{iso_year}-W{iso_week:02d}"
+        if counter.day != day:
+            counter.today = 0.0
+            counter.day = day
+        if counter.iso_week != week:
+            counter.week = 0.0
+            counter.iso_week = week
+
+        if (last := self._last_sample.get(system_id)) is not None:
+            last_time, was_on = last
+            elapsed = now - last_time
+            if elapsed > MAX_SAMPLE_GAP.total_seconds():
+                _LOGGER.debug("Skipping %.0f second gap in runtime samples for system ID %s", elapsed, system_id)
+            elif was_on:
+                counter.today += elapsed
+                counter.week += elapsed
+                counter.lifetime += elapsed
+        self._last_sample[system_id] = (now, is_on)
+
+    def _data_to_save(self) -> RuntimeStoreData:
+        self._save_pending = False
+        return {"counters": {str(system_id): asdict(counter) for system_id, counter in self.counters.items()}}
+
+    async def async_save(self) -> None:
+        """Write the counters to storage immediately, used when the integration is unloaded."""
+        if not self._persist:
+            return
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the stored counters, used when the config entry is removed."""
+        await self._store.async_remove()
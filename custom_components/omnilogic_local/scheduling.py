@@ -0,0 +1,56 @@
+"""Poll scheduling shared by every config entry, so several controllers don't all poll (and update their entities) at the same moment."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import TYPE_CHECKING
+
+from .const import DATA_SCHEDULER, IDLE_SCAN_INTERVAL, MAX_CONCURRENT_REQUESTS
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from homeassistant.core import HomeAssistant
+
+
+class PollScheduler:
+    """Gives each config entry its own phase within the idle poll interval, and caps the controller requests in flight.
+
+    Phases are spread evenly by the order of the entry IDs, so they are the same after every restart and only move when entries are
+    added or removed.
+    """
+
+    def __init__(self) -> None:
+        self.entry_ids: list[str] = []
+        self.request_limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    def register(self, entry_id: str) -> None:
+        if entry_id not in self.entry_ids:
+            self.entry_ids.append(entry_id)
+            self.entry_ids.sort()
+
+    def unregister(self, entry_id: str) -> None:
+        if entry_id in self.entry_ids:
+            self.entry_ids.remove(entry_id)
+
+    def phase(self, entry_id: str) -> float:
+        """Return the offset, in seconds, of the entry's polls within the idle interval."""
+        if entry_id not in self.entry_ids:
+            return 0.0
+        return self.entry_ids.index(entry_id) / len(self.entry_ids) * IDLE_SCAN_INTERVAL.total_seconds()
+
+    def next_slot(self, entry_id: str, now: float, interval: timedelta) -> float:
+        """Return the time, on the loop clock, of the entry's poll slot closest to `interval` from `now`.
+
+        Polls can come up to half an interval early or late, so on average the entry still polls once per interval.
+        """
+        period = interval.total_seconds()
+        phase = self.phase(entry_id) % period
+        return phase + math.ceil((now + period / 2 - phase) / period) * period
+
+
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = PollScheduler()
+    return scheduler
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
-from homeassistant.const import CONCENTRATION_PARTS_PER_MILLION, UnitOfPower, UnitOfTemperature
-from pyomnilogic_local import CSAD, Backyard, Bow, Chlorinator, Filter, HeaterEquipment, Sensor
-from pyomnilogic_local.omnitypes import ChlorinatorDispenserType, CSADType, FilterState, HeaterType, SensorType
-
-from .const import BACKYARD_SYSTEM_ID, DOMAIN, KEY_COORDINATOR
-from .entity import OmniLogicEntity
+from homeassistant.const import CONCENTRATION_PARTS_PER_MILLION, UnitOfEnergy, UnitOfPower, UnitOfTemperature, UnitOfTime
+from pyomnilogic_local import CSAD, Backyard, Bow, Chlorinator, Filter, HeaterEquipment, Pump, Relay, Sensor
+from pyomnilogic_local.omnitypes import ChlorinatorDispenserType, CSADType, HeaterState, HeaterType, SensorType
+
+from .const import (
+    BACKYARD_SYSTEM_ID,
+    DOMAIN,
+    ENTITY_PROFILE_FULL,
+    ENTITY_PROFILE_STANDARD,
+    KEY_COORDINATOR,
+    ROLLING_WINDOWS,
+    SENSOR_KIND_ENERGY,
+    SENSOR_KIND_ORP,
+    SENSOR_KIND_PH,
+    SENSOR_KIND_POWER,
+    SENSOR_KIND_RUNTIME,
+    SENSOR_KIND_SALT,
+    SENSOR_KIND_TEMPERATURE,
+)
+from .energy import filter_power
+from .entity import OmniLogicEntity, OmnilogicEquipment, cycle_cached
+from .entity_profile import apply_entity_profile
 
 if TYPE_CHECKING:
     from datetime import date, datetime
@@ -21,6 +38,7 @@ if TYPE_CHECKING:
     from homeassistant.helpers.typing import StateType
 
     from .coordinator import OmniLogicCoordinator
+    from .stats import RollingWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +47,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     """Set up the sensor platform."""
     coordinator: OmniLogicCoordinator = hass.data[DOMAIN][entry.entry_id][KEY_COORDINATOR]
     entities: list[SensorEntity] = []
+    # Heater equipment whose temperature is already covered by a solar temperature sensor
+    solar_sensor_heater_ids: set[int | None] = set()
 
     # Create sensor entities for all temperature sensors
     for _, _, sensor in coordinator.omni.all_sensors.items():
@@ -56,6 +76,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     case 0:
                         _LOGGER.warning("Unable to locate a solar heater for sensor id: %s", sensor.system_id)
                     case 1:
+                        solar_sensor_heater_ids.add(solar_heaters[0].system_id)
                         entities.append(
                             OmniLogicSolarTemperatureSensorEntity(coordinator=coordinator, sensor=sensor, heater_equipment=solar_heaters[0])
                         )
@@ -76,9 +97,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     sensor.equip_type,
                 )
 
+    # Create state and temperature sensors for each piece of heater equipment
+    for _, _, heater_equip in coordinator.omni.all_heater_equipment.items():
+        entities.append(OmniLogicHeaterEquipStateSensorEntity(coordinator=coordinator, equipment=heater_equip))
+        if heater_equip.system_id not in solar_sensor_heater_ids:
+            entities.append(OmniLogicHeaterEquipTemperatureSensorEntity(coordinator=coordinator, equipment=heater_equip))
+
     # Create energy sensors for filters suitable for inclusion in the energy dashboard
     for _, _, filt in coordinator.omni.all_filters.items():
         entities.append(OmniLogicFilterEnergySensorEntity(coordinator=coordinator, equipment=filt))
+        entities.append(OmniLogicFilterEnergyTotalSensorEntity(coordinator=coordinator, equipment=filt))
+
+    # Create runtime sensors for everything that can be switched on and off
+    runtime_equipment: list[RuntimeEquipment] = [
+        *coordinator.omni.all_filters.values(),
+        *coordinator.omni.all_pumps.values(),
+        *coordinator.omni.all_relays.values(),
+        *coordinator.omni.all_heater_equipment.values(),
+        *coordinator.omni.all_chlorinators.values(),
+    ]
+    for equipment in runtime_equipment:
+        for period in ("today", "week", "lifetime"):
+            entities.append(OmniLogicRuntimeSensorEntity(coordinator=coordinator, equipment=equipment, period=period))
 
     # Create salt level sensors for chlorinators
     for _, _, chlorinator in coordinator.omni.all_chlorinators.items():
@@ -90,6 +130,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                 entities.append(
                     OmniLogicChlorinatorSaltLevelSensorEntity(coordinator=coordinator, equipment=chlorinator, sensor_type="instant")
                 )
+                for window in ROLLING_WINDOWS:
+                    entities.append(
+                        OmniLogicRollingStatisticsSensorEntity(
+                            coordinator=coordinator, equipment=chlorinator, metric=SENSOR_KIND_SALT, window=window
+                        )
+                    )
             case ChlorinatorDispenserType.LIQUID:
                 # It looks like there are no liquid sensors exposed in the telemetry
                 pass
@@ -104,14 +150,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             case CSADType.ACID | CSADType.CO2:
                 entities.append(OmniLogicCSADAcidPhEntity(coordinator=coordinator, equipment=csad))
                 entities.append(OmniLogicCSADAcidORPEntity(coordinator=coordinator, equipment=csad))
+                for window in ROLLING_WINDOWS:
+                    for metric in (SENSOR_KIND_PH, SENSOR_KIND_ORP):
+                        entities.append(
+                            OmniLogicRollingStatisticsSensorEntity(coordinator=coordinator, equipment=csad, metric=metric, window=window)
+                        )
+
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
-    async_add_entities(entities)
+
+class OmniLogicSensorEntity[EquipmentTypes: OmnilogicEquipment](OmniLogicEntity[EquipmentTypes], SensorEntity):
+    """Base sensor entity that only writes readings which are significant according to its publish policy.
+
+    Readings that have not moved by the configured deadband, or arrive before the minimum publish interval has passed, are dropped so
+    that jittery values (ORP, instant salt level, pump power) don't create a new recorder row on every poll.
+    """
+
+    sensor_kind: str | None = None
+    # Attributes that move with the reading itself, changes to these don't force a write and are published along with the value
+    _deadband_attributes: frozenset[str] = frozenset()
+    _published: tuple[bool, Any, dict[str, Any]] | None = None
+    _published_at: float = 0.0
+
+    def _should_write_state(self) -> bool:
+        available = self.available
+        value = self.native_value
+        # The deadband only applies to the value, attributes such as a CSAD's mode and target are written as they change
+        attributes = {name: attribute for name, attribute in self._extra_state_attributes.items() if name not in self._deadband_attributes}
+        now = time.monotonic()
+        policy = self.coordinator.publish_policies.get(self.sensor_kind) if self.sensor_kind is not None else None
+        if (
+            policy is not None
+            and self._published is not None
+            and self._published[0] == available
+            and self._published[2] == attributes
+            and not policy.is_significant(self._published[1], value, now - self._published_at)
+        ):
+            return False
+        self._published = (available, value, attributes)
+        self._published_at = now
+        return True
 
 
 type SensedEquipment = Backyard | Bow | HeaterEquipment
 
 
-class OmniLogicTemperatureSensorEntity[SensedEquipment](OmniLogicEntity[Sensor], SensorEntity):
+class OmniLogicTemperatureSensorEntity[SensedEquipment](OmniLogicSensorEntity[Sensor]):
     """Sensor entity for temperature readings from pool equipment.
 
     Temperature sensors don't have their own telemetry - the readings come from the parent
@@ -122,6 +206,7 @@ class OmniLogicTemperatureSensorEntity[SensedEquipment](OmniLogicEntity[Sensor],
 
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    sensor_kind = SENSOR_KIND_TEMPERATURE
     sensed_id: int
 
     def __init__(self, coordinator: OmniLogicCoordinator, sensor: Sensor) -> None:
@@ -130,7 +215,7 @@ class OmniLogicTemperatureSensorEntity[SensedEquipment](OmniLogicEntity[Sensor],
 
     @property
     def sensed_equipment(self) -> SensedEquipment:
-        return cast(SensedEquipment, self.coordinator.omni.get_equipment_by_id(self.sensed_id))
+        return cast("SensedEquipment", self.coordinator.omni.get_equipment_by_id(self.sensed_id))
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -188,44 +273,150 @@ class OmniLogicSolarTemperatureSensorEntity(OmniLogicTemperatureSensorEntity[Hea
         return temp if temp not in [-1, 255, 65535] else None
 
 
-class OmniLogicFilterEnergySensorEntity(OmniLogicEntity[Filter], SensorEntity):
+class OmniLogicHeaterEquipStateSensorEntity(OmniLogicEntity[HeaterEquipment], SensorEntity):
+    """Sensor entity for the state (off, on or paused) of a piece of heater equipment."""
+
+    entity_profile = ENTITY_PROFILE_STANDARD
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [state.name.lower() for state in HeaterState]
+
+    @property
+    @cycle_cached
+    def icon(self) -> str | None:
+        return "mdi:water-boiler" if self.equipment.is_on else "mdi:water-boiler-off"
+
+    @property
+    def name(self) -> str:
+        return f"{self.equipment.name} Heater Equipment State"
+
+    @property
+    def native_value(self) -> StateType | date | datetime | Decimal:
+        return self.equipment.state.name.lower()
+
+
+class OmniLogicHeaterEquipTemperatureSensorEntity(OmniLogicSensorEntity[HeaterEquipment]):
+    """Sensor entity for the temperature reported by a piece of heater equipment."""
+
+    entity_profile = ENTITY_PROFILE_STANDARD
+
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    sensor_kind = SENSOR_KIND_TEMPERATURE
+
+    @property
+    def name(self) -> str:
+        return f"{self.equipment.name} Heater Equipment Temperature"
+
+    @property
+    def native_value(self) -> StateType | date | datetime | Decimal:
+        temp = self.equipment.current_temp
+        # Heater equipment reports the same invalid readings as the other temperature sources
+        return temp if temp not in [-1, 255, 65535] else None
+
+
+class OmniLogicFilterEnergySensorEntity(OmniLogicSensorEntity[Filter]):
     """Sensor entity for filter power consumption."""
 
+    entity_profile = ENTITY_PROFILE_STANDARD
+
     _attr_device_class = SensorDeviceClass.POWER
     _attr_native_unit_of_measurement = UnitOfPower.WATT
     _attr_state_class = SensorStateClass.MEASUREMENT
+    sensor_kind = SENSOR_KIND_POWER
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
-        return (
-            self.equipment.power
-            if self.equipment.state
-            in [
-                FilterState.ON,
-                FilterState.PRIMING,
-                FilterState.HEATER_EXTEND,
-                FilterState.CSAD_EXTEND,
-                FilterState.FILTER_FORCE_PRIMING,
-                FilterState.FILTER_SUPERCHLORINATE,
-            ]
-            else 0
-        )
+        return filter_power(self.equipment)
 
     @property
     def name(self) -> Any:
         return f"{self.equipment.name} Power"
 
 
-class OmniLogicChlorinatorSaltLevelSensorEntity(OmniLogicEntity[Chlorinator], SensorEntity):
+class OmniLogicFilterEnergyTotalSensorEntity(OmniLogicSensorEntity[Filter]):
+    """Sensor entity for the total energy used by a filter, suitable for the energy dashboard.
+
+    The total is integrated by the coordinator from every power reading, see EnergyMeter.
+    """
+
+    entity_profile = ENTITY_PROFILE_STANDARD
+
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 2
+    sensor_kind = SENSOR_KIND_ENERGY
+
+    @property
+    def native_value(self) -> StateType | date | datetime | Decimal:
+        return round(self.coordinator.energy.totals.get(self.system_id, 0.0), 3)
+
+    @property
+    def name(self) -> Any:
+        return f"{self.equipment.name} Energy"
+
+
+type RuntimeEquipment = Filter | Pump | Relay | HeaterEquipment | Chlorinator
+
+
+class OmniLogicRuntimeSensorEntity(OmniLogicSensorEntity[RuntimeEquipment]):
+    """Sensor entity for how long a piece of equipment has been running today, this week or in total.
+
+    The runtime is counted by the coordinator from every telemetry sample, see RuntimeTracker.
+    """
+
+    entity_profile = ENTITY_PROFILE_FULL
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.HOURS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:timer-outline"
+    sensor_kind = SENSOR_KIND_RUNTIME
+    _period: Literal["today", "week", "lifetime"]
+
+    def __init__(
+        self, coordinator: OmniLogicCoordinator, equipment: RuntimeEquipment, period: Literal["today", "week", "lifetime"]
+    ) -> None:
+        super().__init__(coordinator, equipment)
+        self._period = period
+        # The weekly total is the least commonly needed, keep it out of the way unless someone asks for it
+        self._attr_entity_registry_enabled_default = period != "week"
+
+    @property
+    def native_value(self) -> StateType | date | datetime | Decimal:
+        if (counter := self.coordinator.runtime.counters.get(self.system_id)) is None:
+            return None
+        seconds: float = getattr(counter, self._period)
+        return round(seconds / 3600, 3)
+
+    @property
+    def name(self) -> Any:
+        match self._period:
+            case "today":
+                return f"{self.equipment.name} Runtime Today"
+            case "week":
+                return f"{self.equipment.name} Runtime This Week"
+            case "lifetime":
+                return f"{self.equipment.name} Runtime"
+
+
+class OmniLogicChlorinatorSaltLevelSensorEntity(OmniLogicSensorEntity[Chlorinator]):
     """Sensor entity for chlorinator salt level readings."""
 
     _attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
     _attr_state_class = SensorStateClass.MEASUREMENT
+    sensor_kind = SENSOR_KIND_SALT
     _sensor_type: Literal["average", "instant"]
 
     def __init__(self, coordinator: OmniLogicCoordinator, equipment: Chlorinator, sensor_type: Literal["average", "instant"]) -> None:
         super().__init__(coordinator, equipment)
         self._sensor_type = sensor_type
+        # The average is what the controller acts on, the instant reading is mostly noise on top of it
+        if sensor_type == "instant":
+            self.entity_profile = ENTITY_PROFILE_STANDARD
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
@@ -240,11 +431,17 @@ class OmniLogicChlorinatorSaltLevelSensorEntity(OmniLogicEntity[Chlorinator], Se
         return f"{self.equipment.name} {self._sensor_type.capitalize()} Salt Level"
 
 
-class OmniLogicCSADAcidPhEntity(OmniLogicEntity[CSAD], SensorEntity):
+class OmniLogicCSADAcidPhEntity(OmniLogicSensorEntity[CSAD]):
     """Sensor entity for CSAD acid pH level readings."""
 
     _attr_device_class = SensorDeviceClass.PH
     _attr_state_class = SensorStateClass.MEASUREMENT
+    # The ORP and raw pH readings change on every poll and are already recorded as sensor states, the alarm levels rarely change
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset(
+        {"omni_orp", "omni_ph_value_raw", "omni_calibration_value", "omni_ph_low_alarm_value", "omni_ph_high_alarm_value"}
+    )
+    sensor_kind = SENSOR_KIND_PH
+    _deadband_attributes = frozenset({"omni_orp", "omni_ph_value_raw"})
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
@@ -263,10 +460,14 @@ class OmniLogicCSADAcidPhEntity(OmniLogicEntity[CSAD], SensorEntity):
         }
 
 
-class OmniLogicCSADAcidORPEntity(OmniLogicEntity[CSAD], SensorEntity):
+class OmniLogicCSADAcidORPEntity(OmniLogicSensorEntity[CSAD]):
     """Sensor entity for CSAD ORP level readings."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
+    sensor_kind = SENSOR_KIND_ORP
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset(
+        {"omni_runtime_level", "omni_low_alarm_level", "omni_high_alarm_level", "omni_forced_on_time"}
+    )
     _attr_name = "ORP"
 
     @property
@@ -283,3 +484,61 @@ class OmniLogicCSADAcidORPEntity(OmniLogicEntity[CSAD], SensorEntity):
             "omni_forced_on_time": self.equipment.orp_forced_on_time,
             "omni_forced_enabled": self.equipment.orp_forced_enabled,
         }
+
+
+class OmniLogicRollingStatisticsSensorEntity(OmniLogicSensorEntity[CSAD | Chlorinator]):
+    """Sensor entity for the rolling mean of a water chemistry reading, with the min, max and standard deviation as attributes.
+
+    These replace `statistics` helper sensors, the windows are kept in memory by the coordinator (see ChemistryStats) and start empty
+    after a restart.
+    """
+
+    entity_profile = ENTITY_PROFILE_FULL
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset({"omni_sample_count"})
+    # The window's statistics change with nearly every sample, publish them along with the mean
+    _deadband_attributes = frozenset({"omni_min", "omni_max", "omni_stddev", "omni_sample_count"})
+
+    def __init__(self, coordinator: OmniLogicCoordinator, equipment: CSAD | Chlorinator, metric: str, window: str) -> None:
+        super().__init__(coordinator, equipment)
+        self.sensor_kind = metric
+        self._window = window
+        match metric:
+            case "ph":
+                self._attr_device_class = SensorDeviceClass.PH
+                self._attr_suggested_display_precision = 2
+                self._label = "pH"
+            case "orp":
+                self._attr_suggested_display_precision = 0
+                self._label = "ORP"
+            case "salt":
+                self._attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
+                self._attr_suggested_display_precision = 0
+                self._label = "Salt Level"
+
+    @property
+    def rolling_window(self) -> RollingWindow | None:
+        return self.coordinator.chemistry.get(self.system_id, self.sensor_kind, self._window)
+
+    @property
+    def native_value(self) -> StateType | date | datetime | Decimal:
+        if (window := self.rolling_window) is None or (mean := window.mean) is None:
+            return None
+        return round(mean, 3)
+
+    @property
+    def _extra_state_attributes(self) -> dict[str, Any]:
+        if (window := self.rolling_window) is None or not window:
+            return {}
+        return {
+            "omni_min": window.minimum,
+            "omni_max": window.maximum,
+            "omni_stddev": round(window.stddev or 0.0, 4),
+            "omni_sample_count": len(window),
+        }
+
+    @property
+    def name(self) -> Any:
+        return f"{self.equipment.name} {self._label} {self._window} Mean"
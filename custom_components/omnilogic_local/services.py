@@ -0,0 +1,289 @@
+"""Services for the OmniLogic Local integration."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+from homeassistant.util.color import brightness_to_value
+from pyomnilogic_local import Bow, Chlorinator, ColorLogicLight, Filter, Group, Heater, Pump, Relay
+from pyomnilogic_local.omnitypes import ColorLogicBrightness
+
+from .const import (
+    ATTR_BRIGHTNESS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_DURATION,
+    ATTR_ITEMS,
+    ATTR_SHOW,
+    ATTR_SPEED,
+    ATTR_SPILLOVER,
+    ATTR_STATE,
+    ATTR_SYSTEM_ID,
+    ATTR_TEMPERATURE,
+    ATTR_TRACE_MEMORY,
+    BRIGHTNESS_SCALE,
+    DOMAIN,
+    KEY_COORDINATOR,
+    RECORDING_DIR,
+    SERVICE_APPLY_STATE,
+    SERVICE_PROFILE,
+    SERVICE_RECORD,
+)
+from .light_tracker import PendingLightRequest, async_send_light_request
+from .recording import async_start_recording, async_stop_recording
+from .tracing import async_trace_command
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import OmniLogicCoordinator
+    from .entity import OmnilogicEquipment
+
+_LOGGER = logging.getLogger(__name__)
+
+APPLY_STATE_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_SYSTEM_ID): vol.Coerce(int),
+            vol.Optional(ATTR_STATE): cv.boolean,
+            vol.Optional(ATTR_SPEED): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_SHOW): cv.string,
+            vol.Optional(ATTR_BRIGHTNESS): vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+            vol.Optional(ATTR_TEMPERATURE): vol.Coerce(int),
+            vol.Optional(ATTR_SPILLOVER): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_STATE, ATTR_SPEED, ATTR_SHOW, ATTR_BRIGHTNESS, ATTR_TEMPERATURE, ATTR_SPILLOVER),
+)
+
+APPLY_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ITEMS): vol.All(cv.ensure_list, vol.Length(min=1), [APPLY_STATE_ITEM_SCHEMA]),
+    }
+)
+
+RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=600): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=10): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        vol.Optional(ATTR_TRACE_MEMORY, default=False): cv.boolean,
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_apply_state(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        results = await async_apply_items(coordinator, call.data[ATTR_ITEMS])
+        return {"results": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_STATE,
+        async_apply_state,
+        schema=APPLY_STATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_record(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        if coordinator.recording is not None:
+            msg = f"Already recording to {coordinator.recording.path}"
+            raise ServiceValidationError(msg)
+        path = Path(
+            hass.config.path(
+                RECORDING_DIR, f"recording_{call.data[ATTR_CONFIG_ENTRY_ID]}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.ndjson.gz"
+            )
+        )
+        try:
+            recorder = await async_start_recording(hass, coordinator, path)
+        except TypeError as err:
+            raise ServiceValidationError(str(err)) from err
+
+        async def async_stop(_now: datetime) -> None:
+            # The entry may have been reloaded (ending this recording) and a new one started in the meantime
+            if coordinator.recording is recorder:
+                await async_stop_recording(coordinator)
+
+        async_call_later(hass, call.data[ATTR_DURATION], async_stop)
+        return {"path": str(path)}
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        if coordinator.profiler is not None:
+            msg = f"Already profiling to {coordinator.profiler.path}"
+            raise ServiceValidationError(msg)
+        path = Path(
+            hass.config.path(RECORDING_DIR, f"profile_{call.data[ATTR_CONFIG_ENTRY_ID]}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        )
+        # cProfile, pstats and tracemalloc are only needed when profiling, keep them out of the integration's import time
+        from .profiling import CycleProfiler
+
+        profiler = CycleProfiler(hass, path, call.data[ATTR_CYCLES], call.data[ATTR_TRACE_MEMORY])
+        try:
+            profiler.check_available()
+        except ValueError as err:
+            msg = f"Unable to profile, stop any other profiler (such as the Profiler integration's) first: {err}"
+            raise HomeAssistantError(msg) from err
+        coordinator.profiler = profiler
+        return {"path": str(path)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD,
+        async_record,
+        schema=RECORD_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _get_coordinator(hass: HomeAssistant, entry_id: str) -> OmniLogicCoordinator:
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        msg = f"Config entry {entry_id} is not an OmniLogic Local entry"
+        raise ServiceValidationError(msg)
+    if entry.state is not ConfigEntryState.LOADED:
+        msg = f"Config entry {entry.title} is not loaded"
+        raise ServiceValidationError(msg)
+    coordinator: OmniLogicCoordinator = hass.data[DOMAIN][entry.entry_id][KEY_COORDINATOR]
+    return coordinator
+
+
+async def async_apply_items(coordinator: OmniLogicCoordinator, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Send a list of state changes to the controller in order and refresh once when done.
+
+    Every item is attempted even if an earlier one fails, the result for each item reports whether it
+    succeeded and how long the controller took to accept the command(s).
+    """
+    results: list[dict[str, Any]] = []
+    for item in items:
+        system_id = item[ATTR_SYSTEM_ID]
+        equipment = coordinator.omni.get_equipment_by_id(system_id)
+        result: dict[str, Any] = {
+            ATTR_SYSTEM_ID: system_id,
+            "name": equipment.name if equipment is not None else None,
+            "success": False,
+            "queued": False,
+            "latency": 0.0,
+        }
+        start = time.monotonic()
+        try:
+            if equipment is None:
+                msg = f"No equipment found with system ID {system_id}"
+                raise HomeAssistantError(msg)
+            result["queued"] = await _async_apply_item(coordinator, equipment, item)
+        except Exception as err:  # pylint: disable=broad-except
+            # One failed item should not abort the rest of the pipeline
+            _LOGGER.warning("Failed to apply state to system ID %s: %s", system_id, err)
+            result["error"] = str(err)
+        else:
+            result["success"] = True
+        result["latency"] = round(time.monotonic() - start, 3)
+        results.append(result)
+
+    # Only a single confirmation refresh is needed regardless of how many commands we sent
+    if any(result["success"] for result in results):
+        coordinator.do_next_refresh_after()
+
+    return results
+
+
+async def _async_apply_item(coordinator: OmniLogicCoordinator, equipment: OmnilogicEquipment, item: dict[str, Any]) -> bool:
+    """Translate a single apply_state item into the appropriate equipment command(s), returns True if it was queued instead."""
+    state: bool | None = item.get(ATTR_STATE)
+    match equipment:
+        case ColorLogicLight():
+            return await _async_apply_light(coordinator, equipment, item)
+        case Filter() | Pump():
+            if state is False:
+                await equipment.turn_off()
+            elif (speed := item.get(ATTR_SPEED)) is not None:
+                await equipment.set_speed(speed)
+            elif state:
+                await equipment.turn_on()
+        case Heater():
+            if (temperature := item.get(ATTR_TEMPERATURE)) is not None:
+                await equipment.set_temperature(temperature)
+            if state is not None:
+                await (equipment.turn_on() if state else equipment.turn_off())
+        case Bow():
+            if (spillover := item.get(ATTR_SPILLOVER)) is None:
+                msg = f"{equipment.name} only supports the {ATTR_SPILLOVER} option"
+                raise ServiceValidationError(msg)
+            await (equipment.turn_on_spillover() if spillover else equipment.turn_off_spillover())
+        case Relay() | Chlorinator() | Group():
+            if state is None:
+                msg = f"{equipment.name} only supports the {ATTR_STATE} option"
+                raise ServiceValidationError(msg)
+            await (equipment.turn_on() if state else equipment.turn_off())
+        case _:
+            msg = f"{equipment.name} ({equipment.omni_type}) cannot be controlled with {SERVICE_APPLY_STATE}"
+            raise ServiceValidationError(msg)
+    return False
+
+
+async def _async_apply_light(coordinator: OmniLogicCoordinator, light: ColorLogicLight, item: dict[str, Any]) -> bool:
+    """Send a light item the same way the light entity does, queueing it while the light is transitioning."""
+    requested_show: str | None = item.get(ATTR_SHOW)
+    requested_brightness: int | None = item.get(ATTR_BRIGHTNESS)
+    request = PendingLightRequest(turn_off=item.get(ATTR_STATE) is False)
+    if not request.turn_off:
+        if requested_show is not None:
+            if light.effects is None:
+                msg = f"{light.name} does not support light shows"
+                raise ServiceValidationError(msg)
+            # We need to reformat the show name to match the enum keys
+            request.show = light.effects[requested_show.upper().replace(" ", "_")]
+        if requested_brightness is not None:
+            request.brightness = ColorLogicBrightness(math.ceil(brightness_to_value(BRIGHTNESS_SCALE, requested_brightness)))
+
+    tracker = coordinator.light_tracker(light.system_id)
+    if not light.is_ready:
+        if coordinator.omni.backyard.is_service_mode:
+            msg = f"The OmniLogic backyard is in state {coordinator.omni.backyard.state} and cannot accept commands, try again later."
+            raise HomeAssistantError(msg)
+        # Left unset, the show, speed and brightness are the light's settings at the time the request is sent
+        tracker.queue(request)
+        return True
+
+    entity_id = er.async_get(coordinator.hass).async_get_entity_id("light", DOMAIN, f"{light.bow_id} {light.system_id} {light.name}")
+    command = "async_turn_off" if request.turn_off else "async_turn_on"
+    async with async_trace_command(coordinator, entity_id, light.omni_type or "Unknown", command):
+        if request.turn_off or request.show is not None or request.brightness is not None:
+            await async_send_light_request(light, request)
+        else:
+            await light.turn_on()
+    tracker.pending = None
+    return False
@@ -0,0 +1,92 @@
+"""Flat per equipment snapshots of the telemetry, and the changes between consecutive refreshes."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .const import SNAPSHOT_HISTORY
+
+if TYPE_CHECKING:
+    from pyomnilogic_local import OmniLogic
+    from pyomnilogic_local.models.telemetry import Telemetry
+
+type Snapshot = dict[int, dict[str, Any]]
+# Equipment that disappeared (after an MSP config change) maps to None
+type SnapshotDiff = dict[int, dict[str, Any] | None]
+
+
+def telemetry_snapshot(telemetry: Telemetry) -> Snapshot:
+    """Return the telemetry fields of every piece of equipment, keyed by system ID, as JSON compatible values."""
+    snapshot: Snapshot = {}
+    for field in type(telemetry).model_fields:
+        value = getattr(telemetry, field)
+        items = value if isinstance(value, list) else [value]
+        for item in items:
+            if isinstance(item, BaseModel):
+                snapshot[item.system_id] = item.model_dump(mode="json", exclude={"system_id"})
+    return snapshot
+
+
+def snapshot_diff(old: Snapshot, new: Snapshot) -> SnapshotDiff:
+    """Return only the fields that changed between two snapshots."""
+    diff: SnapshotDiff = {}
+    for system_id, fields in new.items():
+        if (previous := old.get(system_id)) is None:
+            diff[system_id] = fields
+        elif changed := {key: value for key, value in fields.items() if previous.get(key) != value}:
+            diff[system_id] = changed
+    for system_id in old.keys() - new.keys():
+        diff[system_id] = None
+    return diff
+
+
+class TelemetrySnapshots:
+    """Computes the snapshot and diff once per refresh, no matter how many consumers ask for them.
+
+    Nothing is computed while nobody is asking. Every new telemetry seen bumps the generation, consumers take the snapshot (and its
+    generation) when they start and then ask for the changes since the generation they last saw.
+    """
+
+    def __init__(self, omni: OmniLogic) -> None:
+        self.omni = omni
+        self.generation = 0
+        self._telemetry: Telemetry | None = None
+        self._snapshot: Snapshot = {}
+        self._diff: SnapshotDiff = {}
+        # The last SNAPSHOT_HISTORY snapshots by generation, and every system ID seen since startup that is gone now
+        self._history: dict[int, Snapshot] = {0: {}}
+        self._removed: set[int] = set()
+
+    def snapshot(self) -> tuple[int, Snapshot]:
+        self._update()
+        return self.generation, self._snapshot
+
+    def changes_since(self, generation: int) -> tuple[int, SnapshotDiff]:
+        """Return the latest generation and the changes since `generation`."""
+        self._update()
+        if generation == self.generation:
+            return generation, {}
+        if generation == self.generation - 1:
+            return self.generation, self._diff
+        if (seen := self._history.get(generation)) is not None:
+            # The consumer missed a few refreshes, diff against the snapshot it last saw
+            return self.generation, snapshot_diff(seen, self._snapshot)
+        # The consumer missed too many refreshes to know what it has, resend everything and mark whatever it may still show as gone
+        diff: SnapshotDiff = dict.fromkeys(self._removed)
+        diff.update(self._snapshot)
+        return self.generation, diff
+
+    def _update(self) -> None:
+        # The library replaces the telemetry object on every refresh, so identity tells us whether anything new arrived
+        if (telemetry := self.omni.telemetry) is self._telemetry:
+            return
+        snapshot = telemetry_snapshot(telemetry)
+        self._diff = snapshot_diff(self._snapshot, snapshot)
+        self._removed = (self._removed | self._snapshot.keys()) - snapshot.keys()
+        self._snapshot = snapshot
+        self._telemetry = telemetry
+        self.generation += 1
+        self._history[self.generation] = snapshot
+        self._history.pop(self.generation - SNAPSHOT_HISTORY, None)
@@ -0,0 +1,156 @@
+"""Rolling statistics for the water chemistry readings, kept in memory so no recorder queries are needed."""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING
+
+from pyomnilogic_local.omnitypes import ChlorinatorDispenserType
+
+from .const import ROLLING_WINDOWS, SENSOR_KIND_ORP, SENSOR_KIND_PH, SENSOR_KIND_SALT
+
+if TYPE_CHECKING:
+    from pyomnilogic_local import OmniLogic
+
+
+class RollingWindow:
+    """Mean, minimum, maximum and standard deviation of the samples seen in the last `duration` seconds.
+
+    Samples are kept in a pair of ring buffers (timestamps and values) backed by `array`, which only grow when the window holds more
+    samples than ever before. Adding a sample is O(1) amortized: the sum and sum of squares are updated incrementally and the minimum
+    and maximum are tracked with monotonic queues of sample sequence numbers.
+    """
+
+    __slots__ = ("_capacity", "_head", "_max", "_min", "_offset", "_sum", "_sum_squares", "_tail", "_times", "_values", "duration")
+
+    def __init__(self, duration: float, capacity: int = 64) -> None:
+        self.duration = duration
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Sequence numbers of the oldest and next sample, the ring index of a sample is its sequence number modulo the capacity
+        self._head = 0
+        self._tail = 0
+        # Sums are of the values minus an offset (the first sample) to keep the variance calculation numerically stable
+        self._offset = 0.0
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def add(self, value: float, timestamp: float | None = None) -> None:
+        """Add a sample and drop any that have fallen out of the window."""
+        now = time.monotonic() if timestamp is None else timestamp
+        self.evict(now)
+        if not self:
+            self._offset = value
+            self._sum = self._sum_squares = 0.0
+        if len(self) == self._capacity:
+            self._grow()
+
+        seq = self._tail
+        index = seq % self._capacity
+        self._times[index] = now
+        self._values[index] = value
+        self._tail += 1
+        shifted = value - self._offset
+        self._sum += shifted
+        self._sum_squares += shifted * shifted
+
+        while self._min and self._value(self._min[-1]) >= value:
+            self._min.pop()
+        self._min.append(seq)
+        while self._max and self._value(self._max[-1]) <= value:
+            self._max.pop()
+        self._max.append(seq)
+
+    def evict(self, now: float) -> None:
+        """Drop samples older than the window."""
+        cutoff = now - self.duration
+        while self._head < self._tail and self._times[self._head % self._capacity] < cutoff:
+            shifted = self._values[self._head % self._capacity] - self._offset
+            self._sum -= shifted
+            self._sum_squares -= shifted * shifted
+            if self._min[0] == self._head:
+                self._min.popleft()
+            if self._max[0] == self._head:
+                self._max.popleft()
+            self._head += 1
+
+    @property
+    def mean(self) -> float | None:
+        if not self:
+            return None
+        return self._offset + self._sum / len(self)
+
+    @property
+    def minimum(self) -> float | None:
+        return self._value(self._min[0]) if self._min else None
+
+    @property
+    def maximum(self) -> float | None:
+        return self._value(self._max[0]) if self._max else None
+
+    @property
+    def stddev(self) -> float | None:
+        if not self:
+            return None
+        count = len(self)
+        variance = (self._sum_squares - self._sum * self._sum / count) / count
+        # Rounding in the incremental sums can push a zero variance very slightly negative
+        return math.sqrt(max(variance, 0.0))
+
+    def _value(self, seq: int) -> float:
+        return self._values[seq % self._capacity]
+
+    def _grow(self) -> None:
+        capacity = self._capacity * 2
+        times = array("d", bytes(8 * capacity))
+        values = array("d", bytes(8 * capacity))
+        for seq in range(self._head, self._tail):
+            times[seq % capacity] = self._times[seq % self._capacity]
+            values[seq % capacity] = self._values[seq % self._capacity]
+        self._capacity, self._times, self._values = capacity, times, values
+
+
+class ChemistryStats:
+    """Rolling windows for the pH, ORP and salt readings of every CSAD and salt chlorinator."""
+
+    def __init__(self) -> None:
+        self.windows: dict[tuple[int, str], dict[str, RollingWindow]] = {}
+
+    def get(self, system_id: int | None, metric: str, window: str) -> RollingWindow | None:
+        if system_id is None or (windows := self.windows.get((system_id, metric))) is None:
+            return None
+        return windows.get(window)
+
+    def sample(self, omni: OmniLogic) -> None:
+        """Add the latest readings to every window."""
+        now = time.monotonic()
+        # Readings that are skipped never evict anything, age every window here so one that stopped getting samples empties out
+        for windows in self.windows.values():
+            for window in windows.values():
+                window.evict(now)
+        for _, _, csad in omni.all_csads.items():
+            self._add(csad.system_id, SENSOR_KIND_PH, csad.current_ph + csad.calibration_value, now)
+            self._add(csad.system_id, SENSOR_KIND_ORP, csad.current_orp, now)
+        for _, _, chlorinator in omni.all_chlorinators.items():
+            if chlorinator.dispenser_type == ChlorinatorDispenserType.SALT:
+                self._add(chlorinator.system_id, SENSOR_KIND_SALT, chlorinator.instant_salt_level, now)
+
+    def _add(self, system_id: int | None, metric: str, value: float, now: float) -> None:
+        # Zero (or negative) readings are what the controller reports when the sensor isn't reading, don't let them skew the stats
+        if system_id is None or value <= 0:
+            return
+        if (windows := self.windows.get((system_id, metric))) is None:
+            windows = self.windows[(system_id, metric)] = {
+                name: RollingWindow(duration.total_seconds()) for name, duration in ROLLING_WINDOWS.items()
+            }
+        for window in windows.values():
+            window.add(value, now)
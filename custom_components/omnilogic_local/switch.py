@@ -4,7 +4,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
-from pyomnilogic_local import Bow, Chlorinator, Filter, Pump, Relay
+from pyomnilogic_local import Bow, Chlorinator, Filter, Group, Pump, Relay
 from pyomnilogic_local.omnitypes import (
     BodyOfWaterType,
     FilterValvePosition,
@@ -13,7 +13,9 @@ from pyomnilogic_local.omnitypes import (
 )
 
 from .const import DOMAIN, KEY_COORDINATOR
-from .entity import OmniLogicEntity
+from .entity import OmniLogicEntity, cycle_cached
+from .entity_profile import apply_entity_profile
+from .tracing import traced_command
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -55,7 +57,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         if bow.equip_type == BodyOfWaterType.POOL and bow.supports_spillover:
             entities.append(OmniLogicSpilloverSwitchEntity(coordinator=coordinator, equipment=bow))
 
-    async_add_entities(entities)
+    # Add group (theme) switches
+    for _, _, group in coordinator.omni.groups.items():
+        entities.append(OmniLogicGroupSwitchEntity(coordinator=coordinator, equipment=group))
+
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 class OmniLogicRelaySwitchEntity(OmniLogicEntity[Relay], SwitchEntity):
@@ -65,6 +71,7 @@ class OmniLogicRelaySwitchEntity(OmniLogicEntity[Relay], SwitchEntity):
         super().__init__(coordinator, equipment)
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         """Return icon based on relay function."""
         match self.equipment.function:
@@ -77,12 +84,14 @@ class OmniLogicRelaySwitchEntity(OmniLogicEntity[Relay], SwitchEntity):
     def is_on(self) -> bool | None:
         return self.equipment.is_on
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         _LOGGER.debug("turning on relay ID: %s", self.system_id)
         await self.equipment.turn_on()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         _LOGGER.debug("turning off relay ID: %s", self.system_id)
@@ -97,6 +106,7 @@ class OmniLogicPumpSwitchEntity(OmniLogicEntity[Pump], SwitchEntity):
         super().__init__(coordinator, equipment)
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         return "mdi:pump" if self.is_on else "mdi:pump-off"
 
@@ -104,12 +114,14 @@ class OmniLogicPumpSwitchEntity(OmniLogicEntity[Pump], SwitchEntity):
     def is_on(self) -> bool | None:
         return self.equipment.is_on
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         _LOGGER.debug("turning on pump ID: %s", self.system_id)
         await self.equipment.turn_on()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         _LOGGER.debug("turning off pump ID: %s", self.system_id)
@@ -124,6 +136,7 @@ class OmniLogicFilterSwitchEntity(OmniLogicEntity[Filter], SwitchEntity):
         super().__init__(coordinator, equipment)
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         return "mdi:pump" if self.is_on else "mdi:pump-off"
 
@@ -131,12 +144,14 @@ class OmniLogicFilterSwitchEntity(OmniLogicEntity[Filter], SwitchEntity):
     def is_on(self) -> bool | None:
         return self.equipment.is_on
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         _LOGGER.debug("turning on filter ID: %s", self.system_id)
         await self.equipment.turn_on()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         _LOGGER.debug("turning off filter ID: %s", self.system_id)
@@ -158,6 +173,7 @@ class OmniLogicChlorinatorSwitchEntity(OmniLogicEntity[Chlorinator], SwitchEntit
         super().__init__(coordinator, equipment)
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         return "mdi:toggle-switch-variant" if self.is_on else "mdi:toggle-switch-variant-off"
 
@@ -165,12 +181,14 @@ class OmniLogicChlorinatorSwitchEntity(OmniLogicEntity[Chlorinator], SwitchEntit
     def is_on(self) -> bool | None:
         return self.equipment.is_on
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         _LOGGER.debug("turning on chlorinator ID: %s", self.system_id)
         await self.equipment.turn_on()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         _LOGGER.debug("turning off chlorinator ID: %s", self.system_id)
@@ -191,6 +209,7 @@ class OmniLogicSpilloverSwitchEntity(OmniLogicEntity[Bow], SwitchEntity):
         _, _, self.filter = equipment.filters.items()[0]
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         return "mdi:toggle-switch-variant" if self.is_on else "mdi:toggle-switch-variant-off"
 
@@ -199,14 +218,49 @@ class OmniLogicSpilloverSwitchEntity(OmniLogicEntity[Bow], SwitchEntity):
         """Check if spillover is currently active."""
         return self.filter.valve_position == FilterValvePosition.SPILLOVER
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         _LOGGER.debug("turning on spillover ID: %s", self.system_id)
         await self.equipment.turn_on_spillover()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         _LOGGER.debug("turning off spillover ID: %s", self.system_id)
         await self.equipment.turn_off_spillover()
         self.coordinator.do_next_refresh_after()
+
+
+class OmniLogicGroupSwitchEntity(OmniLogicEntity[Group], SwitchEntity):
+    """Switch entity for groups, which are called themes in the OmniLogic app.
+
+    Activating a group is a single command to the controller, which then drives every piece of equipment in the group itself.
+    """
+
+    def __init__(self, coordinator: OmniLogicCoordinator, equipment: Group) -> None:
+        super().__init__(coordinator, equipment)
+
+    @property
+    @cycle_cached
+    def icon(self) -> str | None:
+        return "mdi:palette" if self.is_on else "mdi:palette-outline"
+
+    @property
+    def is_on(self) -> bool | None:
+        return self.equipment.is_on
+
+    @traced_command
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the entity on."""
+        _LOGGER.debug("turning on group ID: %s", self.system_id)
+        await self.equipment.turn_on()
+        self.coordinator.do_next_refresh_after()
+
+    @traced_command
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the entity off."""
+        _LOGGER.debug("turning off group ID: %s", self.system_id)
+        await self.equipment.turn_off()
+        self.coordinator.do_next_refresh_after()
@@ -0,0 +1,195 @@
+"""Trace commands from the entity call until Home Assistant shows the resulting state."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Concatenate
+
+from homeassistant.util import dt as dt_util
+
+from .const import TRACE_HISTORY, TRACE_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Coroutine
+
+    from homeassistant.core import HomeAssistant
+    from pyomnilogic_local.omnitypes import MessageType
+
+    from .coordinator import OmniLogicCoordinator
+    from .entity import OmniLogicEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+# The trace for the command currently being sent, the controller messages are sent from the same task so they can find it here
+current_trace: ContextVar[CommandTrace | None] = ContextVar("omnilogic_local_current_trace", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    start: float
+    duration: float
+
+
+@dataclass(slots=True)
+class CommandTrace:
+    """The stages of a single command, times are relative to when the entity method was called."""
+
+    trace_id: int
+    entity_id: str | None
+    command: str
+    started: float
+    started_at: str
+    # When the entity's state object was last updated before the command, a newer one means the change is visible
+    initial_last_updated: Any
+    spans: list[Span] = field(default_factory=list)
+    command_finished: float | None = None
+    refresh_started: float | None = None
+    refresh_finished: float | None = None
+    outcome: str = "pending"
+    error: str | None = None
+
+    def add_span(self, name: str, start: float, end: float) -> None:
+        self.spans.append(Span(name, round(start - self.started, 4), round(end - start, 4)))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "entity_id": self.entity_id,
+            "command": self.command,
+            "started_at": self.started_at,
+            "outcome": self.outcome,
+            "error": self.error,
+            "spans": [{"name": span.name, "start": span.start, "duration": span.duration} for span in self.spans],
+        }
+
+
+class CommandTracer:
+    """Keeps the traces of the most recent commands.
+
+    A trace is opened when an entity command method is called, collects a span for every message sent to the controller while the
+    command runs, then for the wait until the follow up refresh, the refresh itself, and finally the first state write of the entity
+    after that refresh which changed its state. Traces that never see such a write are closed as unconfirmed after TRACE_TIMEOUT.
+    """
+
+    def __init__(self) -> None:
+        self.open: list[CommandTrace] = []
+        self.completed: deque[CommandTrace] = deque(maxlen=TRACE_HISTORY)
+        self._ids = itertools.count(1)
+        self._refresh_started: float | None = None
+
+    def start(self, hass: HomeAssistant, entity_id: str | None, command: str) -> CommandTrace:
+        state = hass.states.get(entity_id) if entity_id else None
+        trace = CommandTrace(
+            trace_id=next(self._ids),
+            entity_id=entity_id,
+            command=command,
+            started=time.monotonic(),
+            started_at=dt_util.utcnow().isoformat(),
+            initial_last_updated=state.last_updated if state is not None else None,
+        )
+        self.open.append(trace)
+        return trace
+
+    def finish_command(self, trace: CommandTrace, error: Exception | None = None) -> None:
+        trace.command_finished = time.monotonic()
+        trace.add_span("command", trace.started, trace.command_finished)
+        if error is not None:
+            self._complete(trace, "failed")
+            trace.error = str(error)
+
+    # The two methods below make the tracer an ApiListener, they are called from the task that sent the message
+    def on_send(self, message_type: MessageType, message: str | bytes, elapsed: float) -> None:
+        if (trace := current_trace.get()) is not None:
+            now = time.monotonic()
+            trace.add_span(f"controller {message_type.name}", now - elapsed, now)
+
+    def on_exchange(self, message_type: MessageType, message: str | bytes, response: str, elapsed: float) -> None:
+        self.on_send(message_type, message, elapsed)
+
+    def on_refresh_start(self) -> None:
+        if self.open:
+            self._refresh_started = time.monotonic()
+
+    def on_refresh_end(self) -> None:
+        if (refresh_started := self._refresh_started) is None:
+            return
+        self._refresh_started = None
+        now = time.monotonic()
+        for trace in self.open:
+            # Only refreshes that started after the command was acknowledged can confirm it
+            if trace.command_finished is None or trace.command_finished > refresh_started:
+                continue
+            if trace.refresh_started is None:
+                trace.add_span("wait for refresh", trace.command_finished, refresh_started)
+            trace.refresh_started, trace.refresh_finished = refresh_started, now
+            trace.add_span("refresh", refresh_started, now)
+        self._expire(now)
+
+    def on_state_written(self, entity: OmniLogicEntity[Any]) -> None:
+        for trace in list(self.open):
+            if trace.entity_id != entity.entity_id or trace.refresh_finished is None:
+                continue
+            state = entity.hass.states.get(entity.entity_id) if entity.entity_id else None
+            if state is None or state.last_updated == trace.initial_last_updated:
+                continue
+            trace.add_span("state write", trace.refresh_finished, time.monotonic())
+            self._complete(trace, "confirmed")
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        return [trace.as_dict() for trace in (*self.completed, *self.open)]
+
+    def _expire(self, now: float) -> None:
+        for trace in list(self.open):
+            if now - trace.started > TRACE_TIMEOUT.total_seconds():
+                self._complete(trace, "unconfirmed")
+
+    def _complete(self, trace: CommandTrace, outcome: str) -> None:
+        trace.outcome = outcome
+        if trace in self.open:
+            self.open.remove(trace)
+        self.completed.append(trace)
+        _LOGGER.debug("Command trace %s for %s %s: %s", trace.trace_id, trace.entity_id, trace.command, trace.as_dict())
+
+
+@asynccontextmanager
+async def async_trace_command(
+    coordinator: OmniLogicCoordinator, entity_id: str | None, equipment_type: str, command: str
+) -> AsyncIterator[None]:
+    """Trace the command sent inside the block, and count it in the command metrics, unless it is part of a command already traced."""
+    if current_trace.get() is not None:
+        yield
+        return
+    tracer = coordinator.tracer
+    trace = tracer.start(coordinator.hass, entity_id, command)
+    token = current_trace.set(trace)
+    try:
+        yield
+    except Exception as err:
+        tracer.finish_command(trace, err)
+        coordinator.metrics.observe_command(equipment_type, time.monotonic() - trace.started, success=False)
+        raise
+    finally:
+        current_trace.reset(token)
+    tracer.finish_command(trace)
+    coordinator.metrics.observe_command(equipment_type, time.monotonic() - trace.started, success=True)
+
+
+def traced_command[E: OmniLogicEntity[Any], **P, R](
+    func: Callable[Concatenate[E, P], Coroutine[Any, Any, R]],
+) -> Callable[Concatenate[E, P], Coroutine[Any, Any, R]]:
+    """Trace an entity command method, nested calls (e.g. turn_on calling set_operation_mode) are part of the outer trace."""
+
+    @functools.wraps(func)
+    async def wrapper(self: E, *args: P.args, **kwargs: P.kwargs) -> R:
+        async with async_trace_command(self.coordinator, self.entity_id, self.equipment.omni_type or "Unknown", func.__name__):
+            return await func(self, *args, **kwargs)
+
+    return wrapper
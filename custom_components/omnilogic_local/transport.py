@@ -0,0 +1,75 @@
+"""An OmniLogic API client that lets the integration observe every message sent to and received from the controller."""
+
+from __future__ import annotations
+
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Protocol
+
+from pyomnilogic_local.api.api import OmniLogicAPI
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import AsyncIterator
+
+    from pyomnilogic_local.omnitypes import MessageType
+
+
+class ApiListener(Protocol):
+    """Receives a callback for every message exchanged with the controller."""
+
+    def on_send(self, message_type: MessageType, message: str | bytes, elapsed: float) -> None:
+        """Handle a command that was sent to, and acknowledged by, the controller `elapsed` seconds after it was sent."""
+
+    def on_exchange(self, message_type: MessageType, message: str | bytes, response: str, elapsed: float) -> None:
+        """Handle a request and the response the controller sent back."""
+
+
+class InstrumentedOmniLogicAPI(OmniLogicAPI):
+    """OmniLogicAPI that notifies registered listeners after every message.
+
+    All of the high level API calls (telemetry, MSP config, equipment commands) are built on top of async_send and
+    async_send_and_receive, so overriding those two covers all controller traffic. Subclasses can override _async_send and
+    _async_send_and_receive to change where the messages go.
+    """
+
+    def __init__(self, controller_ip: str, controller_port: int, response_timeout: float) -> None:
+        super().__init__(controller_ip, controller_port, response_timeout)
+        self.listeners: list[ApiListener] = []
+        # Shared by all config entries to cap the requests in flight across every controller, see scheduling.py
+        self.request_limiter: asyncio.Semaphore | None = None
+        # Total time requests spent waiting for the limiter
+        self.limiter_wait = 0.0
+
+    @asynccontextmanager
+    async def _limited(self) -> AsyncIterator[None]:
+        if self.request_limiter is None:
+            yield
+            return
+        start = time.monotonic()
+        async with self.request_limiter:
+            self.limiter_wait += time.monotonic() - start
+            yield
+
+    async def async_send(self, message_type: MessageType, message: str) -> None:
+        async with self._limited():
+            start = time.monotonic()
+            await self._async_send(message_type, message)
+            elapsed = time.monotonic() - start
+        for listener in self.listeners:
+            listener.on_send(message_type, message, elapsed)
+
+    async def async_send_and_receive(self, message_type: MessageType, message: str) -> str:
+        async with self._limited():
+            start = time.monotonic()
+            response = await self._async_send_and_receive(message_type, message)
+            elapsed = time.monotonic() - start
+        for listener in self.listeners:
+            listener.on_exchange(message_type, message, response, elapsed)
+        return response
+
+    async def _async_send(self, message_type: MessageType, message: str) -> None:
+        await super().async_send(message_type, message)
+
+    async def _async_send_and_receive(self, message_type: MessageType, message: str) -> str:
+        return await super().async_send_and_receive(message_type, message)
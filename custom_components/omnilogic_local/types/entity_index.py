@@ -1,37 +1,38 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TypeVar
-
-from pyomnilogic_local.models.mspconfig import (
-    MSPCSAD,
-    MSPBackyard,
-    MSPBoW,
-    MSPChlorinator,
-    MSPChlorinatorEquip,
-    MSPColorLogicLight,
-    MSPFilter,
-    MSPHeaterEquip,
-    MSPPump,
-    MSPRelay,
-    MSPSchedule,
-    MSPSensor,
-    MSPVirtualHeater,
-)
-from pyomnilogic_local.models.telemetry import (
-    TelemetryBackyard,
-    TelemetryBoW,
-    TelemetryChlorinator,
-    TelemetryColorLogicLight,
-    TelemetryCSAD,
-    TelemetryFilter,
-    TelemetryGroup,
-    TelemetryHeater,
-    TelemetryPump,
-    TelemetryRelay,
-    TelemetryValveActuator,
-    TelemetryVirtualHeater,
-)
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from pyomnilogic_local.models.mspconfig import (
+        MSPCSAD,
+        MSPBackyard,
+        MSPBoW,
+        MSPChlorinator,
+        MSPChlorinatorEquip,
+        MSPColorLogicLight,
+        MSPFilter,
+        MSPHeaterEquip,
+        MSPPump,
+        MSPRelay,
+        MSPSchedule,
+        MSPSensor,
+        MSPVirtualHeater,
+    )
+    from pyomnilogic_local.models.telemetry import (
+        TelemetryBackyard,
+        TelemetryBoW,
+        TelemetryChlorinator,
+        TelemetryColorLogicLight,
+        TelemetryCSAD,
+        TelemetryFilter,
+        TelemetryGroup,
+        TelemetryHeater,
+        TelemetryPump,
+        TelemetryRelay,
+        TelemetryValveActuator,
+        TelemetryVirtualHeater,
+    )
 
 
 @dataclass
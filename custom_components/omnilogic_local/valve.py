@@ -8,7 +8,9 @@ from pyomnilogic_local import Relay
 from pyomnilogic_local.omnitypes import RelayFunction, RelayType
 
 from .const import DOMAIN, KEY_COORDINATOR
-from .entity import OmniLogicEntity
+from .entity import OmniLogicEntity, config_cached, cycle_cached
+from .entity_profile import apply_entity_profile
+from .tracing import traced_command
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -32,13 +34,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         if relay.relay_type == RelayType.VALVE_ACTUATOR:
             entities.append(OmniLogicValveEntity(coordinator=coordinator, equipment=relay))
 
-    async_add_entities(entities)
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 class OmniLogicValveEntity(OmniLogicEntity[Relay], ValveEntity):
     """Valve entity for valve actuator relays."""
 
     _attr_supported_features = ValveEntityFeature.OPEN | ValveEntityFeature.CLOSE
+    _unrecorded_attributes = OmniLogicEntity._unrecorded_attributes | frozenset({"omni_function", "omni_type"})
 
     def __init__(self, coordinator: OmniLogicCoordinator, equipment: Relay) -> None:
         super().__init__(coordinator, equipment)
@@ -54,6 +57,7 @@ class OmniLogicValveEntity(OmniLogicEntity[Relay], ValveEntity):
         return not self.equipment.is_on
 
     @property
+    @cycle_cached
     def icon(self) -> str | None:
         """Return icon based on valve function."""
         match self.equipment.function:
@@ -66,21 +70,29 @@ class OmniLogicValveEntity(OmniLogicEntity[Relay], ValveEntity):
             case _:
                 return "mdi:valve-open" if not self.is_closed else "mdi:valve-closed"
 
+    @property
+    @config_cached
+    def _static_state_attributes(self) -> dict[str, Any]:
+        return super()._static_state_attributes | {
+            "omni_function": str(self.equipment.function),
+            "omni_type": str(self.equipment.relay_type),
+        }
+
     @property
     def _extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
         return {
-            "omni_function": str(self.equipment.function),
-            "omni_type": str(self.equipment.relay_type),
             "omni_why_on": str(self.equipment.why_on),
         }
 
+    @traced_command
     async def async_open_valve(self, **kwargs: Any) -> None:
         """Open the valve."""
         _LOGGER.debug("opening valve ID: %s", self.system_id)
         await self.equipment.turn_on()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_close_valve(self, **kwargs: Any) -> None:
         """Close the valve."""
         _LOGGER.debug("closing valve ID: %s", self.system_id)
@@ -9,6 +9,8 @@ from pyomnilogic_local import Heater
 
 from .const import DOMAIN, KEY_COORDINATOR
 from .entity import OmniLogicEntity
+from .entity_profile import apply_entity_profile
+from .tracing import traced_command
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -28,7 +30,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for _, _, heater in coordinator.omni.all_heaters.items():
         entities.append(OmniLogicWaterHeaterEntity(coordinator=coordinator, equipment=heater))
 
-    async_add_entities(entities)
+    async_add_entities(apply_entity_profile(coordinator, entities))
 
 
 class OmniLogicWaterHeaterEntity(OmniLogicEntity[Heater], WaterHeaterEntity):
@@ -77,11 +79,13 @@ class OmniLogicWaterHeaterEntity(OmniLogicEntity[Heater], WaterHeaterEntity):
     def current_operation(self) -> str:
         return str(STATE_ON) if self.equipment.is_on else str(STATE_OFF)
 
+    @traced_command
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperature."""
         await self.equipment.set_temperature(int(kwargs[ATTR_TEMPERATURE]))
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set operation mode."""
         match operation_mode:
@@ -91,27 +95,21 @@ class OmniLogicWaterHeaterEntity(OmniLogicEntity[Heater], WaterHeaterEntity):
                 await self.equipment.turn_off()
         self.coordinator.do_next_refresh_after()
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         await self.async_set_operation_mode("on")
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self.async_set_operation_mode("off")
 
     @property
     def _extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        extra_state_attributes: dict[str, Any] = {
+        """Return extra state attributes.
+
+        The state and temperature of each piece of heater equipment are exposed as their own sensor entities.
+        """
+        return {
             "omni_solar_set_point": self.equipment.solar_set_point,
             "omni_why_on": self.equipment.why_on,
         }
-        for _, system_id, heater_equip in self.equipment.heater_equipment.items():
-            name = heater_equip.name or "unknown"
-            prefix = f"omni_heater_equip_{name}_"
-            extra_state_attributes |= {
-                f"{prefix}_enabled": heater_equip.enabled,
-                f"{prefix}_system_id": system_id,
-                f"{prefix}_bow_id": heater_equip.bow_id,
-                f"{prefix}_state": str(heater_equip.state),
-                f"{prefix}_current_temp": heater_equip.current_temp,
-            }
-        return extra_state_attributes
@@ -0,0 +1,65 @@
+"""Websocket API streaming the telemetry of a config entry, for custom dashboard cards."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+
+from .const import DOMAIN, KEY_COORDINATOR
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import OmniLogicCoordinator
+    from .snapshot import Snapshot, SnapshotDiff
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+def _keyed_by_str(equipment: Snapshot | SnapshotDiff) -> dict[str, Any]:
+    # JSON object keys are strings, convert here so every client sees the same keys regardless of the JSON encoder
+    return {str(system_id): fields for system_id, fields in equipment.items()}
+
+
+@callback
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+def ws_subscribe(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Send a snapshot of all equipment, then the fields that changed after each refresh.
+
+    Events are `{"type": "snapshot", "available": bool, "equipment": {system_id: {field: value}}}` followed by
+    `{"type": "diff", "available": bool, "equipment": {system_id: {field: value} | null}}`, null meaning the equipment was removed.
+    """
+    if (entry_data := hass.data.get(DOMAIN, {}).get(msg["entry_id"])) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not found or not loaded")
+        return
+    coordinator: OmniLogicCoordinator = entry_data[KEY_COORDINATOR]
+    available = coordinator.last_update_success
+    generation, snapshot = coordinator.snapshots.snapshot()
+
+    @callback
+    def forward_changes() -> None:
+        nonlocal available, generation
+        generation, diff = coordinator.snapshots.changes_since(generation)
+        if not diff and available == coordinator.last_update_success:
+            return
+        available = coordinator.last_update_success
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"type": "diff", "available": available, "equipment": _keyed_by_str(diff)})
+        )
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(forward_changes)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"type": "snapshot", "available": available, "equipment": _keyed_by_str(snapshot)})
+    )
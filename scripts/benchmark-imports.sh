@@ -0,0 +1,77 @@
+#!/usr/bin/env bash
+# Measure the import time of the integration package and each of its platform modules.
+#
+# Every module is imported in a fresh interpreter (so nothing is already cached) with `python -X importtime`, the cumulative time of
+# the module itself is reported, along with the slowest imports it pulled in. Run from the repository root in an environment with
+# Home Assistant and python-omnilogic-local installed:
+#
+#   scripts/benchmark-imports.sh                # report only
+#   IMPORT_BUDGET_MS=400 scripts/benchmark-imports.sh   # fail if any module takes longer than 400ms
+#
+# Set RUNS to change how many times each module is imported (the fastest run is reported) and TOP to change how many of the slowest
+# imports are listed for the package.
+
+set -euo pipefail
+
+PYTHON="${PYTHON:-python}"
+RUNS="${RUNS:-5}"
+TOP="${TOP:-15}"
+IMPORT_BUDGET_MS="${IMPORT_BUDGET_MS:-}"
+PACKAGE="custom_components.omnilogic_local"
+MODULES=(
+  ""
+  binary_sensor
+  button
+  config_flow
+  diagnostics
+  light
+  number
+  sensor
+  switch
+  valve
+  water_heater
+)
+
+# Print the cumulative import time (microseconds) of a module, the fastest of RUNS fresh imports
+import_time() {
+  local module="$1" best="" run cumulative
+  for ((run = 0; run < RUNS; run++)); do
+    cumulative=$("${PYTHON}" -X importtime -c "import ${module}" 2>&1 >/dev/null |
+      awk -F'|' -v module="${module}" '{ gsub(/ /, "", $3) } $3 == module { gsub(/ /, "", $2); print $2 }')
+    if [[ -z "${best}" || "${cumulative}" -lt "${best}" ]]; then
+      best="${cumulative}"
+    fi
+  done
+  echo "${best}"
+}
+
+if ! "${PYTHON}" -c "import ${PACKAGE}" 2>/dev/null; then
+  echo "Unable to import ${PACKAGE}, run this from the repository root with Home Assistant and python-omnilogic-local installed"
+  exit 1
+fi
+
+over_budget=0
+printf "%-50s %10s\n" "module" "ms"
+for name in "${MODULES[@]}"; do
+  module="${PACKAGE}${name:+.${name}}"
+  microseconds=$(import_time "${module}")
+  milliseconds=$((microseconds / 1000))
+  flag=""
+  if [[ -n "${IMPORT_BUDGET_MS}" && "${milliseconds}" -gt "${IMPORT_BUDGET_MS}" ]]; then
+    flag="  over budget"
+    over_budget=1
+  fi
+  printf "%-50s %10s%s\n" "${module}" "${milliseconds}" "${flag}"
+done
+
+echo
+echo "Slowest imports (self time) when importing ${PACKAGE}:"
+"${PYTHON}" -X importtime -c "import ${PACKAGE}" 2>&1 >/dev/null |
+  awk -F'|' 'NR > 1 { gsub(/^import time: */, "", $1); printf "%10.1f ms  %s\n", $1 / 1000, $3 }' |
+  sort -rn | head -n "${TOP}"
+
+if [[ "${over_budget}" -ne 0 ]]; then
+  echo
+  echo "One or more modules exceeded the ${IMPORT_BUDGET_MS}ms import budget"
+  exit 1
+fi